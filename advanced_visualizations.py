@@ -8,13 +8,48 @@ import sys
 import math
 import numpy as np
 from datetime import datetime, timedelta
-from collections import deque
-import random
+from collections import deque, OrderedDict
 
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+    HAS_OPENGL = True
+except ImportError:
+    HAS_OPENGL = False
+
+from frame_clock import FrameClock, is_showing
+
+
+class _BrushCache:
+    """
+    Small LRU cache of gradient brushes keyed on quantized paint parameters
+    """
+
+    def __init__(self, capacity: int = 32):
+        self._capacity = capacity
+        self._brushes = OrderedDict()
+
+    def get(self, key, factory):
+        """Return the brush for key, building it with factory() on a miss"""
+        brush = self._brushes.get(key)
+        if brush is None:
+            brush = factory()
+            self._brushes[key] = brush
+            if len(self._brushes) > self._capacity:
+                self._brushes.popitem(last=False)
+        else:
+            self._brushes.move_to_end(key)
+        return brush
+
 
 # ============================================================================
 # ANIMATED RADAR CHART
@@ -36,46 +71,64 @@ class AnimatedRadarChart(QWidget):
         self.categories = categories or ["Speed", "Power", "Defense", "Range", "Control"]
         self.max_value = max_value
 
-        # Values for each category
-        self._values = {cat: 0 for cat in self.categories}
-        self._target_values = {cat: 0 for cat in self.categories}
-        self._display_values = {cat: 0 for cat in self.categories}
+        # Values for each category, indexed through _cat_idx
+        self._cat_idx = {cat: i for i, cat in enumerate(self.categories)}
+        self._target = np.zeros(len(self.categories))
+        self._display = np.zeros(len(self.categories))
 
         # Animation
         self._rotation_phase = 0.0
         self._pulse_phase = 0.0
         self._scan_angle = 0.0
 
+        # Axis direction tables, rotated once per frame in _animate
+        num_categories = len(self.categories)
+        base_angles = 2 * np.pi * np.arange(num_categories) / num_categories - np.pi / 2
+        self._base_cos = np.cos(base_angles)
+        self._base_sin = np.sin(base_angles)
+        self._cos_cache = self._base_cos.copy()
+        self._sin_cache = self._base_sin.copy()
+
         # Colors
         self.primary_color = QColor(0, 200, 255)
         self.secondary_color = QColor(255, 100, 150)
         self.grid_color = QColor(60, 70, 80)
 
-        self.setMinimumSize(350, 350)
+        # Static background and grid, rendered once per size
+        self._bg_cache = None
 
-        # Animation timers
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Scan line and trail fan, rendered once per size and rotated when drawn
+        self._scan_sprite = None
 
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_values)
-        self.value_timer.start(16)
+        # Data fill gradients, keyed on geometry and quantized pulse
+        self._fill_brushes = _BrushCache()
+
+        self.setMinimumSize(350, 350)
+
+        # Animation driven by the shared frame clock
+        self._easing = True
+        FrameClock.instance().attach(self, self._animate)
 
     def setValue(self, category: str, value: float):
         """Set value for a category"""
-        if category in self._target_values:
-            self._target_values[category] = max(0, min(self.max_value, value))
+        idx = self._cat_idx.get(category)
+        if idx is not None:
+            self._target[idx] = max(0, min(self.max_value, value))
+            self._easing = True
 
     def setValues(self, values: dict):
         """Set multiple values"""
         for category, value in values.items():
             self.setValue(category, value)
 
-    def _animate(self):
-        self._rotation_phase += 0.01
-        self._pulse_phase += 0.05
-        self._scan_angle += 2  # degrees
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            return
+
+        step = dt * 60  # frames elapsed at 60 fps
+        self._rotation_phase += 0.01 * step
+        self._pulse_phase += 0.05 * step
+        self._scan_angle += 2 * step  # degrees
 
         if self._rotation_phase > 2 * math.pi:
             self._rotation_phase -= 2 * math.pi
@@ -84,13 +137,30 @@ class AnimatedRadarChart(QWidget):
         if self._scan_angle >= 360:
             self._scan_angle -= 360
 
+        self._update_axis_tables()
+
+        if self._easing:
+            self._animate_values(step)
+
         self.update()
 
-    def _animate_values(self):
-        for category in self._target_values:
-            diff = self._target_values[category] - self._display_values[category]
-            if abs(diff) > 0.1:
-                self._display_values[category] += diff * 0.08
+    def _update_axis_tables(self):
+        """Rotate the base axis directions by the current (slight) rotation"""
+        offset = self._rotation_phase * 0.2
+        cos_off = math.cos(offset)
+        sin_off = math.sin(offset)
+
+        self._cos_cache = self._base_cos * cos_off - self._base_sin * sin_off
+        self._sin_cache = self._base_sin * cos_off + self._base_cos * sin_off
+
+    def _animate_values(self, step: float):
+        diff = self._target - self._display
+        moving = np.abs(diff) > 0.1
+        if not moving.any():
+            # Values have settled; setValue() resumes easing
+            self._easing = False
+            return
+        self._display[moving] += diff[moving] * (1 - 0.92 ** step)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -103,11 +173,10 @@ class AnimatedRadarChart(QWidget):
         center_y = height / 2 + 10
         radius = min(width, height) / 2 - 50
 
-        # Draw background
-        self._draw_background(painter, center_x, center_y, radius)
-
-        # Draw grid
-        self._draw_grid(painter, center_x, center_y, radius)
+        # Draw cached background and grid
+        if self._bg_cache is None:
+            self._bg_cache = self._build_bg_cache(center_x, center_y, radius)
+        painter.drawPixmap(0, 0, self._bg_cache)
 
         # Draw axes and labels
         self._draw_axes(painter, center_x, center_y, radius)
@@ -115,15 +184,38 @@ class AnimatedRadarChart(QWidget):
         # Draw scan line
         self._draw_scan_line(painter, center_x, center_y, radius)
 
+        # Data polygon and points share one set of vertices
+        xs, ys = self._data_vertices(center_x, center_y, radius)
+
         # Draw data polygon
-        self._draw_data(painter, center_x, center_y, radius)
+        self._draw_data(painter, center_x, center_y, radius, xs, ys)
 
         # Draw data points
-        self._draw_data_points(painter, center_x, center_y, radius)
+        self._draw_data_points(painter, xs, ys)
 
         # Draw title
         self._draw_title(painter, width)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_cache = None
+        self._scan_sprite = None
+
+    def _build_bg_cache(self, cx, cy, r):
+        """Render the size-dependent background and grid into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(painter, cx, cy, r)
+        self._draw_grid(painter, cx, cy, r)
+        painter.end()
+
+        return cache
+
     def _draw_background(self, painter, cx, cy, r):
         """Draw radar background"""
         # Outer glow
@@ -131,7 +223,7 @@ class AnimatedRadarChart(QWidget):
             glow_color = QColor(self.primary_color)
             glow_color.setAlpha(int(10 * (11 - i) / 10))
 
-            painter.setBrush(QBrush(glow_color))
+            painter.setBrush(glow_color)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(QPointF(cx, cy), r + i * 3, r + i * 3)
 
@@ -167,32 +259,20 @@ class AnimatedRadarChart(QWidget):
 
     def _draw_axes(self, painter, cx, cy, r):
         """Draw axes and category labels"""
-        num_categories = len(self.categories)
-
-        for i, category in enumerate(self.categories):
-            angle = 2 * math.pi * i / num_categories - math.pi / 2
-            angle += self._rotation_phase * 0.2  # Slight rotation
-
-            # Axis line
-            end_x = cx + r * math.cos(angle)
-            end_y = cy + r * math.sin(angle)
+        # Axis lines, all with the same pen in one call
+        center = QPointF(cx, cy)
+        painter.setPen(QPen(self.grid_color, 1))
+        painter.drawLines([QLineF(center, QPointF(cx + r * cos_a, cy + r * sin_a))
+                           for cos_a, sin_a in zip(self._cos_cache, self._sin_cache)])
 
-            # Gradient line
-            line_gradient = QLinearGradient(cx, cy, end_x, end_y)
-            line_gradient.setColorAt(0, QColor(self.grid_color.red(), self.grid_color.green(),
-                                              self.grid_color.blue(), 50))
-            line_gradient.setColorAt(1, self.grid_color)
-
-            painter.setPen(QPen(QBrush(line_gradient), 1))
-            painter.drawLine(QPointF(cx, cy), QPointF(end_x, end_y))
+        painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        painter.setPen(QPen(self.primary_color))
 
+        for i, category in enumerate(self.categories):
             # Category label
             label_r = r + 25
-            label_x = cx + label_r * math.cos(angle)
-            label_y = cy + label_r * math.sin(angle)
-
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            painter.setPen(QPen(self.primary_color))
+            label_x = cx + label_r * self._cos_cache[i]
+            label_y = cy + label_r * self._sin_cache[i]
 
             # Adjust text alignment based on position
             text_rect = QRectF(label_x - 40, label_y - 10, 80, 20)
@@ -200,14 +280,33 @@ class AnimatedRadarChart(QWidget):
 
     def _draw_scan_line(self, painter, cx, cy, r):
         """Draw rotating scan line effect"""
-        angle_rad = math.radians(self._scan_angle)
-
-        # Scan line
-        end_x = cx + r * math.cos(angle_rad)
-        end_y = cy + r * math.sin(angle_rad)
+        if self._scan_sprite is None:
+            self._scan_sprite = self._build_scan_sprite(r)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.translate(cx, cy)
+        painter.rotate(self._scan_angle)
+        painter.drawPixmap(QPointF(-1, -math.ceil(r) - 1), self._scan_sprite)
+        painter.restore()
+
+    def _build_scan_sprite(self, r):
+        """
+        Render the scan line and its trailing fan pointing east (+X) into a
+        pixmap whose bottom-left corner sits one pixel off the radar center
+        """
+        size = math.ceil(r) + 2
+        dpr = self.devicePixelRatioF()
+        sprite = QPixmap(int(size * dpr), int(size * dpr))
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(1, size - 1)
 
         # Gradient for scan effect
-        scan_gradient = QLinearGradient(cx, cy, end_x, end_y)
+        scan_gradient = QLinearGradient(0, 0, r, 0)
         scan_color = QColor(self.primary_color)
         scan_gradient.setColorAt(0, QColor(scan_color.red(), scan_color.green(),
                                           scan_color.blue(), 0))
@@ -217,91 +316,83 @@ class AnimatedRadarChart(QWidget):
                                           scan_color.blue(), 200))
 
         painter.setPen(QPen(QBrush(scan_gradient), 2))
-        painter.drawLine(QPointF(cx, cy), QPointF(end_x, end_y))
+        painter.drawLine(QPointF(0, 0), QPointF(r, 0))
 
         # Trailing fade effect
         for i in range(20):
-            trail_angle = math.radians(self._scan_angle - i * 2)
-            trail_x = cx + r * math.cos(trail_angle)
-            trail_y = cy + r * math.sin(trail_angle)
+            trail_angle = math.radians(-i * 2)
+            trail_x = r * math.cos(trail_angle)
+            trail_y = r * math.sin(trail_angle)
 
             trail_color = QColor(self.primary_color)
             trail_color.setAlpha(int(50 * (20 - i) / 20))
 
             painter.setPen(QPen(trail_color, 1))
-            painter.drawLine(QPointF(cx, cy), QPointF(trail_x, trail_y))
+            painter.drawLine(QPointF(0, 0), QPointF(trail_x, trail_y))
 
-    def _draw_data(self, painter, cx, cy, r):
-        """Draw the data polygon"""
-        num_categories = len(self.categories)
-        points = []
-
-        for i, category in enumerate(self.categories):
-            angle = 2 * math.pi * i / num_categories - math.pi / 2
-            angle += self._rotation_phase * 0.2
-
-            value = self._display_values.get(category, 0)
-            value_r = r * value / self.max_value
-
-            point_x = cx + value_r * math.cos(angle)
-            point_y = cy + value_r * math.sin(angle)
-            points.append(QPointF(point_x, point_y))
+        painter.end()
+        return sprite
 
-        if len(points) < 3:
+    def _draw_data(self, painter, cx, cy, r, xs, ys):
+        """Draw the data polygon"""
+        if len(self._display) < 3:
             return
 
-        # Create polygon path
+        # Create polygon path from the vertex arrays in one call
         path = QPainterPath()
-        path.moveTo(points[0])
-        for point in points[1:]:
-            path.lineTo(point)
+        path.addPolygon(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
         path.closeSubpath()
 
         # Pulse effect
         pulse_intensity = 0.6 + 0.4 * math.sin(self._pulse_phase)
 
-        # Glow layers
-        for i in range(4, 0, -1):
-            glow_color = QColor(self.primary_color)
-            glow_color.setAlpha(int(30 * pulse_intensity * (5 - i) / 4))
+        # Glow layers, skipped while the pulse is too dim to show them
+        if pulse_intensity >= 0.3:
+            for i in range(4, 0, -1):
+                glow_color = QColor(self.primary_color)
+                glow_color.setAlpha(int(30 * pulse_intensity * (5 - i) / 4))
+
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.setPen(QPen(glow_color, i * 2))
+                painter.drawPath(path)
+
+        # Fill gradient, pulse quantized to 0.02 steps for cache hits
+        pulse_step = int(pulse_intensity * 50)
+        key = (int(cx), int(cy), int(r), pulse_step)
+        painter.setBrush(self._fill_brushes.get(
+            key, lambda: self._make_fill_brush(cx, cy, r, pulse_step / 50)))
+        painter.setPen(QPen(self.primary_color, 2))
+        painter.drawPath(path)
 
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.setPen(QPen(glow_color, i * 2))
-            painter.drawPath(path)
+    def _data_vertices(self, cx, cy, r):
+        """Return x and y arrays of the data polygon vertices"""
+        value_r = r * self._display / self.max_value
+        return cx + value_r * self._cos_cache, cy + value_r * self._sin_cache
 
-        # Fill gradient
+    def _make_fill_brush(self, cx, cy, r, pulse_intensity):
         fill_gradient = QRadialGradient(cx, cy, r)
         fill_color = QColor(self.primary_color)
         fill_color.setAlpha(int(80 * pulse_intensity))
         fill_gradient.setColorAt(0, fill_color)
         fill_color.setAlpha(int(40 * pulse_intensity))
         fill_gradient.setColorAt(1, fill_color)
+        return QBrush(fill_gradient)
 
-        painter.setBrush(QBrush(fill_gradient))
-        painter.setPen(QPen(self.primary_color, 2))
-        painter.drawPath(path)
-
-    def _draw_data_points(self, painter, cx, cy, r):
+    def _draw_data_points(self, painter, xs, ys):
         """Draw animated data points"""
-        num_categories = len(self.categories)
-
-        for i, category in enumerate(self.categories):
-            angle = 2 * math.pi * i / num_categories - math.pi / 2
-            angle += self._rotation_phase * 0.2
-
-            value = self._display_values.get(category, 0)
-            value_r = r * value / self.max_value
-
-            point_x = cx + value_r * math.cos(angle)
-            point_y = cy + value_r * math.sin(angle)
+        # Value labels sit 15 px further out along each axis
+        label_xs = xs + 15 * self._cos_cache
+        label_ys = ys + 15 * self._sin_cache
 
+        for i, (value, point_x, point_y, label_x, label_y) in enumerate(zip(
+                self._display.tolist(), xs.tolist(), ys.tolist(), label_xs.tolist(), label_ys.tolist())):
             # Pulse size
             pulse_size = 5 + 2 * math.sin(self._pulse_phase + i)
 
             # Outer glow
             glow_color = QColor(self.primary_color)
             glow_color.setAlpha(100)
-            painter.setBrush(QBrush(glow_color))
+            painter.setBrush(glow_color)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(QPointF(point_x, point_y), pulse_size + 4, pulse_size + 4)
 
@@ -314,10 +405,6 @@ class AnimatedRadarChart(QWidget):
             painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
             painter.setPen(QPen(QColor(255, 255, 255)))
 
-            label_offset = 15
-            label_x = point_x + label_offset * math.cos(angle)
-            label_y = point_y + label_offset * math.sin(angle)
-
             label_rect = QRectF(label_x - 20, label_y - 8, 40, 16)
             painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, f"{value:.0f}")
 
@@ -334,6 +421,36 @@ class AnimatedRadarChart(QWidget):
 # ANIMATED HEATMAP
 # ============================================================================
 
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _heatmap_kernel(data, phase, lut, out_rgb):
+        """Apply the wave effect and color LUT to every cell, writing RGB into out_rgb"""
+        rows, cols = data.shape
+
+        for r in range(rows):
+            for c in range(cols):
+                v = data[r, c] + math.sin(phase + r * 0.3 + c * 0.2) * 0.05
+                if v < 0.0:
+                    v = 0.0
+                elif v > 1.0:
+                    v = 1.0
+
+                k = int(v * 255)
+                for ch in range(3):
+                    out_rgb[r, c, ch] = lut[k, ch]
+
+        return out_rgb
+else:
+    def _heatmap_kernel(data, phase, lut, out_rgb):
+        """Apply the wave effect and color LUT to every cell, writing RGB into out_rgb"""
+        rows, cols = data.shape
+        wave = np.sin(phase + np.arange(rows)[:, None] * 0.3 + np.arange(cols)[None, :] * 0.2) * 0.05
+        values = np.clip(data + wave, 0, 1)
+
+        out_rgb[:] = lut[(values * 255).astype(np.intp)]
+        return out_rgb
+
+
 class AnimatedHeatmap(QWidget):
     """
     Animated heatmap with smooth color transitions
@@ -355,9 +472,9 @@ class AnimatedHeatmap(QWidget):
         self.col_labels = col_labels or [f"{i:02d}:00" for i in range(cols)]
 
         # Data matrix
-        self._data = np.zeros((rows, cols))
-        self._target_data = np.zeros((rows, cols))
-        self._display_data = np.zeros((rows, cols))
+        self._data = np.zeros((rows, cols), dtype=np.float32)
+        self._target_data = np.zeros((rows, cols), dtype=np.float32)
+        self._display_data = np.zeros((rows, cols), dtype=np.float32)
 
         # Animation
         self._wave_phase = 0.0
@@ -370,54 +487,66 @@ class AnimatedHeatmap(QWidget):
             (0.75, QColor(255, 200, 50)),
             (1.0, QColor(255, 50, 50)),
         ]
+        self._build_lut()
+        self._rgb = np.zeros((rows, cols, 3), dtype=np.uint8)
 
-        self.setMinimumSize(600, 300)
+        # One pixel per cell, scaled up to the chart area when drawn
+        self._image = QImage(cols, rows, QImage.Format.Format_RGB32)
+        self._grid_cache = None
 
-        # Animation timers
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        self.setMinimumSize(600, 300)
 
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_values)
-        self.value_timer.start(50)
+        # Animation driven by the shared frame clock
+        self._easing = True
+        FrameClock.instance().attach(self, self._animate)
 
     def setData(self, data: np.ndarray):
-        """Set heatmap data"""
-        self._target_data = np.clip(data, 0, 1)
+        """Set heatmap data (rows x cols), clipped into the existing target buffer"""
+        np.clip(data, 0, 1, out=self._target_data)
+        self._easing = True
 
     def setValue(self, row: int, col: int, value: float):
         """Set single cell value"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
             self._target_data[row, col] = max(0, min(1, value))
+            self._easing = True
+
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            return
 
-    def _animate(self):
-        self._wave_phase += 0.05
+        self._wave_phase += 0.05 * dt * 60
         if self._wave_phase > 2 * math.pi:
             self._wave_phase -= 2 * math.pi
+
+        if self._easing:
+            self._animate_values(dt)
+
         self.update()
 
-    def _animate_values(self):
+    def _animate_values(self, dt: float):
         diff = self._target_data - self._display_data
         mask = np.abs(diff) > 0.001
-        self._display_data[mask] += diff[mask] * 0.1
+        if not mask.any():
+            # Data has settled; setData()/setValue() resume easing
+            self._easing = False
+            return
+        # Eases 10% of the remaining distance every 50 ms
+        self._display_data[mask] += diff[mask] * (1 - 0.9 ** (dt / 0.05))
+
+    def _build_lut(self):
+        """Bake color_stops into a 256-entry RGB lookup table; call again after changing them"""
+        stops_v = np.array([stop for stop, _ in self.color_stops])
+        t = np.linspace(0, 1, 256)
+        self._lut = np.stack([np.interp(t, stops_v, [c.red() for _, c in self.color_stops]),
+                              np.interp(t, stops_v, [c.green() for _, c in self.color_stops]),
+                              np.interp(t, stops_v, [c.blue() for _, c in self.color_stops])],
+                             axis=1).astype(np.uint8)
 
     def _value_to_color(self, value: float) -> QColor:
         """Convert value to color using color map"""
-        value = max(0, min(1, value))
-
-        for i in range(len(self.color_stops) - 1):
-            v1, c1 = self.color_stops[i]
-            v2, c2 = self.color_stops[i + 1]
-
-            if v1 <= value <= v2:
-                t = (value - v1) / (v2 - v1)
-                r = int(c1.red() + (c2.red() - c1.red()) * t)
-                g = int(c1.green() + (c2.green() - c1.green()) * t)
-                b = int(c1.blue() + (c2.blue() - c1.blue()) * t)
-                return QColor(r, g, b)
-
-        return self.color_stops[-1][1]
+        r, g, b = self._lut[min(255, max(0, int(value * 255)))]
+        return QColor(int(r), int(g), int(b))
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -439,32 +568,18 @@ class AnimatedHeatmap(QWidget):
         cell_width = chart_width / self.cols
         cell_height = chart_height / self.rows
 
-        # Draw cells
-        for row in range(self.rows):
-            for col in range(self.cols):
-                value = self._display_data[row, col]
-
-                # Add wave effect
-                wave_offset = math.sin(self._wave_phase + row * 0.3 + col * 0.2) * 0.05
-                display_value = max(0, min(1, value + wave_offset))
-
-                x = margin_left + col * cell_width
-                y = margin_top + row * cell_height
+        # Wave effect and color mapping for all cells in one pass
+        rgb = _heatmap_kernel(self._display_data, self._wave_phase, self._lut, self._rgb)
+        self._blend_hot_cells(rgb)
+        self._upload_image(rgb)
 
-                color = self._value_to_color(display_value)
+        # Draw cells as a single scaled blit, then the cached cell borders
+        chart_rect = QRectF(margin_left, margin_top, chart_width, chart_height)
+        painter.drawImage(chart_rect, self._image)
 
-                # Cell background
-                painter.setBrush(QBrush(color))
-                painter.setPen(QPen(QColor(30, 30, 40), 1))
-                painter.drawRect(QRectF(x, y, cell_width, cell_height))
-
-                # Highlight high values
-                if value > 0.8:
-                    glow_intensity = 0.5 + 0.5 * math.sin(self._wave_phase * 2 + row + col)
-                    glow_color = QColor(255, 255, 255, int(50 * glow_intensity))
-                    painter.setBrush(QBrush(glow_color))
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.drawRect(QRectF(x + 2, y + 2, cell_width - 4, cell_height - 4))
+        if self._grid_cache is None:
+            self._grid_cache = self._build_grid_cache(margin_left, margin_top, cell_width, cell_height)
+        painter.drawPixmap(0, 0, self._grid_cache)
 
         # Draw row labels
         painter.setFont(QFont("Arial", 8))
@@ -492,6 +607,58 @@ class AnimatedHeatmap(QWidget):
         title_rect = QRectF(0, 10, width, 30)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._grid_cache = None
+
+    def _blend_hot_cells(self, rgb):
+        """Highlight high values by blending a pulsing white glow into their cells"""
+        rows, cols = np.nonzero(self._display_data > 0.8)
+        if len(rows) == 0:
+            return
+
+        glow_intensity = 0.5 + 0.5 * np.sin(self._wave_phase * 2 + rows + cols)
+        glow = (50 / 255 * glow_intensity)[:, None]
+
+        cells = rgb[rows, cols].astype(np.float64)
+        rgb[rows, cols] = (cells + (255 - cells) * glow).astype(np.uint8)
+
+    def _upload_image(self, rgb):
+        """Pack the RGB array into the cell image"""
+        ptr = self._image.bits()
+        ptr.setsize(self._image.sizeInBytes())
+        pixels = np.frombuffer(ptr, dtype=np.uint32).reshape(self.rows, -1)[:, :self.cols]
+
+        pixels[:] = (0xFF000000
+                     | (rgb[..., 0].astype(np.uint32) << 16)
+                     | (rgb[..., 1].astype(np.uint32) << 8)
+                     | rgb[..., 2])
+
+    def _build_grid_cache(self, x, y, cell_width, cell_height):
+        """Render the cell borders once into a transparent pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(30, 30, 40), 1))
+
+        w = cell_width * self.cols
+        h = cell_height * self.rows
+
+        for row in range(self.rows + 1):
+            line_y = y + row * cell_height
+            painter.drawLine(QPointF(x, line_y), QPointF(x + w, line_y))
+
+        for col in range(self.cols + 1):
+            line_x = x + col * cell_width
+            painter.drawLine(QPointF(line_x, y), QPointF(line_x, y + h))
+
+        painter.end()
+        return cache
+
     def _draw_color_scale(self, painter, x, y, w, h):
         """Draw color scale legend"""
         # Gradient bar
@@ -517,15 +684,118 @@ class AnimatedHeatmap(QWidget):
 # PARTICLE EFFECT BACKGROUND
 # ============================================================================
 
-class ParticleBackground(QWidget):
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _scan_neighbours(a, px, py, cell, cols, rows, start, order, pos, out_i, out_j, out_alpha):
+        """
+        Visit the pairs (a, b > a) closer than `cell` in a's 3x3 neighbouring
+        grid cells. Writes them from index `pos` unless pos is negative, and
+        returns how many there are.
+        """
+        ax = int(px[a] / cell)
+        ay = int(py[a] / cell)
+        r2 = cell * cell
+        count = 0
+
+        for gy in range(max(ay - 1, 0), min(ay + 2, rows)):
+            for gx in range(max(ax - 1, 0), min(ax + 2, cols)):
+                c = gy * cols + gx
+                for s in range(start[c], start[c + 1]):
+                    b = order[s]
+                    if b <= a:
+                        continue
+                    dx = px[a] - px[b]
+                    dy = py[a] - py[b]
+                    d2 = dx * dx + dy * dy
+                    if d2 < r2:
+                        if pos >= 0:
+                            out_i[pos + count] = a
+                            out_j[pos + count] = b
+                            out_alpha[pos + count] = int(50 * (1 - math.sqrt(d2) / cell))
+                        count += 1
+
+        return count
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _connection_kernel(px, py, cell, out_i, out_j, out_alpha):
+        """
+        Find particle pairs closer than `cell` using a uniform grid of that cell
+        size, so each particle is only tested against its 3x3 neighbouring cells.
+        Writes (i, j, alpha) for every pair if they fit in the output buffers
+        and returns the total pair count.
+        """
+        n = px.shape[0]
+        if n == 0:
+            return 0
+
+        cols = int(px.max() / cell) + 1
+        rows = int(py.max() / cell) + 1
+
+        # Counting sort of particle indices by cell id
+        cell_id = np.empty(n, np.int64)
+        for k in range(n):
+            cell_id[k] = int(py[k] / cell) * cols + int(px[k] / cell)
+
+        start = np.zeros(rows * cols + 1, np.int64)
+        for k in range(n):
+            start[cell_id[k] + 1] += 1
+        for c in range(rows * cols):
+            start[c + 1] += start[c]
+
+        order = np.empty(n, np.int64)
+        fill = start[:-1].copy()
+        for k in range(n):
+            order[fill[cell_id[k]]] = k
+            fill[cell_id[k]] += 1
+
+        # Pass 1: count pairs per particle in parallel
+        counts = np.zeros(n + 1, np.int64)
+        for a in prange(n):
+            counts[a + 1] = _scan_neighbours(a, px, py, cell, cols, rows, start, order,
+                                             -1, out_i, out_j, out_alpha)
+
+        offsets = np.cumsum(counts)
+        total = offsets[n]
+        if total > out_i.shape[0]:
+            return total
+
+        # Pass 2: each particle writes its pairs into its own output slice
+        for a in prange(n):
+            _scan_neighbours(a, px, py, cell, cols, rows, start, order,
+                             offsets[a], out_i, out_j, out_alpha)
+
+        return total
+else:
+    def _connection_kernel(px, py, cell, out_i, out_j, out_alpha):
+        """
+        Find particle pairs closer than `cell` with a broadcast distance matrix.
+        Writes (i, j, alpha) for every pair if they fit in the output buffers
+        and returns the total pair count.
+        """
+        dx = px[:, None] - px[None, :]
+        dy = py[:, None] - py[None, :]
+        d2 = dx * dx + dy * dy
+
+        # Upper triangle only, so each pair is visited once
+        i, j = np.nonzero(np.triu(d2 < cell * cell, 1))
+        count = len(i)
+        if count > out_i.shape[0]:
+            return count
+
+        out_i[:count] = i
+        out_j[:count] = j
+        out_alpha[:count] = 50 * (1 - np.sqrt(d2[i, j]) / cell)
+
+        return count
+
+
+class _ParticleSystem:
     """
-    Animated particle background effect
+    Particle state, animation and painting shared by the QWidget and
+    OpenGL particle backgrounds
     """
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
-        self.particles = []
+    def _setup_particles(self):
         self.num_particles = 100
 
         # Initialize particles
@@ -535,75 +805,153 @@ class ParticleBackground(QWidget):
         self.connection_distance = 150
         self.show_connections = True
 
-        # Animation timer
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # One pen per possible line alpha (0-50), created once
+        self._line_pens = [QPen(QColor(0, 200, 255, a), 1) for a in range(51)]
+
+        # Animation driven by the shared frame clock
+        FrameClock.instance().attach(self, self._animate)
 
         # Make widget transparent to mouse events
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
     def _init_particles(self):
         """Initialize particles with random positions and velocities"""
-        for _ in range(self.num_particles):
-            self.particles.append({
-                'x': random.uniform(0, 1920),
-                'y': random.uniform(0, 1080),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'size': random.uniform(1, 3),
-                'alpha': random.uniform(50, 150),
-            })
-
-    def _animate(self):
+        n = self.num_particles
+
+        # Structure-of-arrays particle state, float32 for compact contiguous rows
+        self.px = np.random.uniform(0, 1920, n).astype(np.float32)
+        self.py = np.random.uniform(0, 1080, n).astype(np.float32)
+        self.vx = np.random.uniform(-0.5, 0.5, n).astype(np.float32)
+        self.vy = np.random.uniform(-0.5, 0.5, n).astype(np.float32)
+        self.size = np.random.uniform(1, 3, n).astype(np.float32)
+        self.alpha = np.random.uniform(50, 150, n).astype(np.float32)
+        self._brushes = [QBrush(QColor(0, 200, 255, int(a))) for a in self.alpha]
+
+        # Output buffers for the connection search, grown on demand
+        self._pair_i = np.empty(n * 8, np.int64)
+        self._pair_j = np.empty(n * 8, np.int64)
+        self._pair_alpha = np.empty(n * 8, np.int32)
+
+    def _animate(self, dt: float):
         """Update particle positions"""
+        if not is_showing(self):
+            return
+
         width = self.width() or 1920
         height = self.height() or 1080
+        step = dt * 60  # velocities are in pixels per 60 fps frame
 
-        for p in self.particles:
-            # Update position
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-
-            # Wrap around edges
-            if p['x'] < 0:
-                p['x'] = width
-            elif p['x'] > width:
-                p['x'] = 0
-
-            if p['y'] < 0:
-                p['y'] = height
-            elif p['y'] > height:
-                p['y'] = 0
+        # Update positions and wrap around edges
+        self.px += self.vx * step
+        self.py += self.vy * step
+        np.mod(self.px, width, out=self.px)
+        np.mod(self.py, height, out=self.py)
 
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def _connection_pairs(self):
+        """Return (i, j, alpha) for every particle pair closer than connection_distance"""
+        cell = float(self.connection_distance)
+        count = _connection_kernel(self.px, self.py, cell,
+                                   self._pair_i, self._pair_j, self._pair_alpha)
+
+        if count > len(self._pair_i):
+            # Buffers were too small; grow them and search again
+            size = count * 2
+            self._pair_i = np.empty(size, np.int64)
+            self._pair_j = np.empty(size, np.int64)
+            self._pair_alpha = np.empty(size, np.int32)
+            count = _connection_kernel(self.px, self.py, cell,
+                                       self._pair_i, self._pair_j, self._pair_alpha)
+
+        i = self._pair_i[:count]
+        j = self._pair_j[:count]
+        alpha = self._pair_alpha[:count]
+        return i, j, alpha
+
+    def _paint_particles(self, painter):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw connections
         if self.show_connections:
-            for i, p1 in enumerate(self.particles):
-                for p2 in self.particles[i+1:]:
-                    dx = p2['x'] - p1['x']
-                    dy = p2['y'] - p1['y']
-                    distance = math.sqrt(dx * dx + dy * dy)
+            i, j, alpha = self._connection_pairs()
 
-                    if distance < self.connection_distance:
-                        alpha = int(50 * (1 - distance / self.connection_distance))
-                        line_color = QColor(0, 200, 255, alpha)
+            # Group lines by alpha so each pen is set once per batch
+            order = np.argsort(alpha, kind='stable')
+            alpha = alpha[order]
+            coords = np.column_stack((self.px[i], self.py[i], self.px[j], self.py[j]))[order].tolist()
 
-                        painter.setPen(QPen(line_color, 1))
-                        painter.drawLine(QPointF(p1['x'], p1['y']),
-                                        QPointF(p2['x'], p2['y']))
+            levels, starts = np.unique(alpha, return_index=True)
+            ends = np.append(starts[1:], len(alpha))
+            for level, start, end in zip(levels, starts, ends):
+                painter.setPen(self._line_pens[level])
+                painter.drawLines([QLineF(*line) for line in coords[start:end]])
 
         # Draw particles
-        for p in self.particles:
-            color = QColor(0, 200, 255, int(p['alpha']))
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(p['x'], p['y']), p['size'], p['size'])
+        painter.setPen(Qt.PenStyle.NoPen)
+        for x, y, size, brush in zip(self.px, self.py, self.size, self._brushes):
+            painter.setBrush(brush)
+            painter.drawEllipse(QPointF(x, y), size, size)
+
+
+class ParticleBackground(_ParticleSystem, QWidget):
+    """
+    Animated particle background effect
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._setup_particles()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self._paint_particles(painter)
+
+
+if HAS_OPENGL:
+    class GLParticleBackground(_ParticleSystem, QOpenGLWidget):
+        """
+        Particle background painted through Qt's OpenGL paint engine
+        """
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+
+            # GL surfaces are opaque, so paint the window color ourselves
+            self.background_color = QColor(5, 8, 13)
+
+            # Multisampling stands in for QPainter antialiasing on GL
+            surface_format = self.format()
+            surface_format.setSamples(4)
+            self.setFormat(surface_format)
+
+            self._setup_particles()
+
+        def paintGL(self):
+            painter = QPainter(self)
+            painter.fillRect(self.rect(), self.background_color)
+            self._paint_particles(painter)
+
+
+def configure_opengl():
+    """
+    Set the default GL surface format; must run before QApplication is created
+    so every QOpenGLWidget shares a context with the same 2.1 multisampled format
+    """
+    if not HAS_OPENGL:
+        return
+    surface_format = QSurfaceFormat()
+    surface_format.setVersion(2, 1)
+    surface_format.setSamples(4)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+
+
+def create_particle_background(parent=None):
+    """Return the OpenGL particle background if a GL context can be created, else the QWidget one"""
+    if HAS_OPENGL and QOpenGLContext().create():
+        return GLParticleBackground(parent)
+    return ParticleBackground(parent)
 
 
 # ============================================================================
@@ -635,39 +983,60 @@ class AnimatedProgressRing(QWidget):
         self._rotation_angle = 0
         self._glow_phase = 0
 
-        self.setMinimumSize(150, 170)
+        # Unit offsets of the 8 orbiting dots at zero rotation
+        dot_angles = np.radians(np.arange(8) * 45)
+        self._dot_cos = np.cos(dot_angles)
+        self._dot_sin = np.sin(dot_angles)
+        self._dot_phase = np.arange(8)
 
-        # Animation timers
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Static background ring, rendered once per size
+        self._ring_cache = None
 
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_value)
-        self.value_timer.start(16)
+        # Progress arc gradients, keyed on center and percentage
+        self._arc_brushes = _BrushCache()
+
+        self.setMinimumSize(150, 170)
+
+        # Animation driven by the shared frame clock
+        self._easing = True
+        FrameClock.instance().attach(self, self._animate)
 
     def setValue(self, value: float):
         self._target_value = max(self.min_value, min(self.max_value, value))
+        self._easing = True
 
     def value(self) -> float:
         return self._current_value
 
-    def _animate(self):
-        self._rotation_angle += 1
-        self._glow_phase += 0.05
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            # value() is public, so keep easing while off screen
+            if self._easing:
+                self._animate_value(dt * 60)
+            return
+
+        step = dt * 60  # frames elapsed at 60 fps
+        self._rotation_angle += step
+        self._glow_phase += 0.05 * step
 
         if self._rotation_angle >= 360:
-            self._rotation_angle = 0
+            self._rotation_angle -= 360
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
 
+        if self._easing:
+            self._animate_value(step)
+
         self.update()
 
-    def _animate_value(self):
+    def _animate_value(self, step: float):
         diff = self._target_value - self._display_value
         if abs(diff) > 0.01:
-            self._display_value += diff * 0.08
+            self._display_value += diff * (1 - 0.92 ** step)
             self._current_value = self._display_value
+        else:
+            # Value has settled; setValue() resumes easing
+            self._easing = False
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -682,12 +1051,13 @@ class AnimatedProgressRing(QWidget):
 
         percentage = (self._display_value - self.min_value) / (self.max_value - self.min_value)
 
-        # Background ring
-        painter.setPen(QPen(QColor(40, 50, 60), 10))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-
         arc_rect = QRectF(center_x - radius, center_y - radius, radius * 2, radius * 2)
-        painter.drawArc(arc_rect, 0, 360 * 16)
+
+        # Cached background ring
+        if self._ring_cache is None:
+            self._ring_cache = self._build_ring_cache(arc_rect)
+        painter.drawPixmap(0, 0, self._ring_cache)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
 
         # Glow effect
         glow_intensity = 0.6 + 0.4 * math.sin(self._glow_phase)
@@ -701,29 +1071,30 @@ class AnimatedProgressRing(QWidget):
             painter.setPen(pen)
             painter.drawArc(arc_rect, 90 * 16, -int(360 * 16 * percentage))
 
-        # Progress arc
-        arc_gradient = QConicalGradient(center_x, center_y, 90)
-        arc_gradient.setColorAt(0, self.color)
-        arc_gradient.setColorAt(percentage, self.color.lighter(150))
-        arc_gradient.setColorAt(percentage + 0.01, QColor(0, 0, 0, 0))
+        # Progress arc; the gradient only changes while the value is easing
+        key = (int(center_x), int(center_y), round(percentage, 3))
+        arc_brush = self._arc_brushes.get(
+            key, lambda: self._make_arc_brush(center_x, center_y, percentage))
 
-        pen = QPen(QBrush(arc_gradient), 10)
+        pen = QPen(arc_brush, 10)
         pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         painter.setPen(pen)
         painter.drawArc(arc_rect, 90 * 16, -int(360 * 16 * percentage))
 
-        # Rotating dots
-        for i in range(8):
-            dot_angle = math.radians(self._rotation_angle + i * 45)
-            dot_x = center_x + (radius + 18) * math.cos(dot_angle)
-            dot_y = center_y - (radius + 18) * math.sin(dot_angle)
-
-            dot_alpha = int(100 + 100 * math.sin(self._glow_phase + i))
-            dot_color = QColor(self.color)
-            dot_color.setAlpha(dot_alpha)
-
-            painter.setBrush(QBrush(dot_color))
-            painter.setPen(Qt.PenStyle.NoPen)
+        # Rotating dots: rotate the base offsets by the current angle
+        rot = math.radians(self._rotation_angle)
+        cos_r = math.cos(rot)
+        sin_r = math.sin(rot)
+        orbit = radius + 18
+        dot_xs = center_x + orbit * (self._dot_cos * cos_r - self._dot_sin * sin_r)
+        dot_ys = center_y - orbit * (self._dot_sin * cos_r + self._dot_cos * sin_r)
+        dot_alphas = (100 + 100 * np.sin(self._glow_phase + self._dot_phase)).astype(int)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        dot_color = QColor(self.color)
+        for dot_x, dot_y, dot_alpha in zip(dot_xs, dot_ys, dot_alphas):
+            dot_color.setAlpha(int(dot_alpha))
+            painter.setBrush(dot_color)
             painter.drawEllipse(QPointF(dot_x, dot_y), 3, 3)
 
         # Center text
@@ -741,11 +1112,76 @@ class AnimatedProgressRing(QWidget):
         title_rect = QRectF(center_x - 50, center_y + radius + 15, 100, 20)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._ring_cache = None
+
+    def _make_arc_brush(self, cx, cy, percentage):
+        arc_gradient = QConicalGradient(cx, cy, 90)
+        arc_gradient.setColorAt(0, self.color)
+        arc_gradient.setColorAt(percentage, self.color.lighter(150))
+        arc_gradient.setColorAt(percentage + 0.01, QColor(0, 0, 0, 0))
+        return QBrush(arc_gradient)
+
+    def _build_ring_cache(self, arc_rect):
+        """Render the dark background ring into a transparent pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(40, 50, 60), 10))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawArc(arc_rect, 0, 360 * 16)
+        painter.end()
+
+        return cache
+
 
 # ============================================================================
 # ANIMATED WAVEFORM
 # ============================================================================
 
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _waveform_step(values, targets, ease, phase, offsets, out_display):
+        """
+        Ease values toward targets and write the wave-modulated, clipped bar
+        values into out_display. Returns the largest distance to target seen
+        before easing.
+        """
+        max_diff = 0.0
+        for i in range(values.shape[0]):
+            diff = targets[i] - values[i]
+            if abs(diff) > max_diff:
+                max_diff = abs(diff)
+            values[i] += diff * ease
+
+            v = values[i] + math.sin(phase + offsets[i]) * 0.1
+            if v < 0.05:
+                v = 0.05
+            elif v > 1.0:
+                v = 1.0
+            out_display[i] = v
+
+        return max_diff
+else:
+    def _waveform_step(values, targets, ease, phase, offsets, out_display):
+        """
+        Ease values toward targets and write the wave-modulated, clipped bar
+        values into out_display. Returns the largest distance to target seen
+        before easing.
+        """
+        diff = targets - values
+        max_diff = float(np.abs(diff).max()) if len(diff) else 0.0
+        values += diff * ease
+
+        np.clip(values + np.sin(phase + offsets) * 0.1, 0.05, 1, out=out_display)
+        return max_diff
+
+
 class AnimatedWaveform(QWidget):
     """
     Animated audio-style waveform visualization
@@ -763,38 +1199,127 @@ class AnimatedWaveform(QWidget):
         self.color = color or QColor(0, 255, 150)
 
         # Bar values
-        self._values = [0.0] * num_bars
-        self._target_values = [0.0] * num_bars
+        self._values = np.zeros(num_bars, dtype=np.float32)
+        self._target_values = np.zeros(num_bars, dtype=np.float32)
 
         # Animation
         self._phase = 0
+        self._bar_phase_offsets = np.arange(num_bars, dtype=np.float32) * 0.3
+        self._display_values = np.full(num_bars, 0.05, dtype=np.float32)
+
+        # Cached (bar x array, bar x list, bar width), rebuilt after a resize
+        self._bar_geometry = None
+
+        # Bar heights (px) and glow rows as last painted, used to find dirty bars
+        self._painted_heights = np.full(num_bars, -1.0, dtype=np.float32)
+        self._painted_rows = np.full(num_bars, -1, dtype=np.int32)
+
+        self._build_glow_brushes()
 
         self.setMinimumSize(300, 100)
 
-        # Animation timer
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Animation driven by the shared frame clock
+        self._easing = False
+        FrameClock.instance().attach(self, self._animate)
+
+    def _build_glow_brushes(self):
+        """
+        Precreate the bar brush and glow brushes indexed [layer][bucket], with
+        the bar value quantized into 16 buckets; call again after changing color
+        """
+        self._glow_brushes = {}
+        for j in range(1, 4):
+            layer = []
+            for bucket in range(16):
+                glow_intensity = 0.5 + 0.5 * bucket / 15
+                glow_color = QColor(self.color)
+                glow_color.setAlpha(int(40 * glow_intensity * (4 - j) / 3))
+                layer.append(QBrush(glow_color))
+            self._glow_brushes[j] = layer
+
+        self._glow_atlas = None
+
+        # Bar gradient in object coordinates, so one brush stretches over each bar's path
+        bar_gradient = QLinearGradient(0, 0, 0, 1)
+        bar_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+        bar_gradient.setColorAt(0, self.color.lighter(150))
+        bar_gradient.setColorAt(0.5, self.color)
+        bar_gradient.setColorAt(1, self.color.lighter(150))
+        self._bar_brush = QBrush(bar_gradient)
+
+    def _build_glow_atlas(self, bar_width):
+        """
+        Pre-render the stacked glow layers for every value bucket into one
+        pixmap. Each bucket is a 4-row strip: 3 rows of top falloff followed
+        by 1 row of the horizontal profile, which is stretched along the bar.
+        """
+        dpr = self.devicePixelRatioF()
+        atlas = QPixmap(math.ceil((math.ceil(bar_width) + 6) * dpr), math.ceil(16 * 4 * dpr))
+        atlas.setDevicePixelRatio(dpr)
+        atlas.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(atlas)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for bucket in range(16):
+            for j in range(3, 0, -1):
+                painter.setBrush(self._glow_brushes[j][bucket])
+                painter.drawRect(QRectF(3 - j, bucket * 4 + 3 - j, bar_width + j * 2, 1 + j))
+        painter.end()
+
+        return atlas
 
     def setValues(self, values: list):
         """Set bar values (0-1)"""
-        for i, v in enumerate(values[:self.num_bars]):
-            self._target_values[i] = max(0, min(1, v))
+        values = np.asarray(values[:self.num_bars], dtype=np.float32)
+        np.clip(values, 0, 1, out=self._target_values[:len(values)])
+        self._easing = True
 
     def setRandomValues(self):
         """Set random values for testing"""
-        for i in range(self.num_bars):
-            self._target_values[i] = random.uniform(0.1, 1.0)
+        self._target_values[:] = np.random.uniform(0.1, 1.0, self.num_bars)
+        self._easing = True
 
-    def _animate(self):
-        self._phase += 0.1
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            return
 
-        # Smooth value transitions
-        for i in range(self.num_bars):
-            diff = self._target_values[i] - self._values[i]
-            self._values[i] += diff * 0.2
+        step = dt * 60  # frames elapsed at 60 fps
+        self._phase += 0.1 * step
+
+        # Smooth value transitions until the bars settle, plus the wave effect
+        ease = 1 - 0.8 ** step if self._easing else 0.0
+        max_diff = _waveform_step(self._values, self._target_values, ease, self._phase,
+                                  self._bar_phase_offsets, self._display_values)
+        if self._easing and max_diff < 5e-4:
+            self._values[:] = self._target_values
+            self._easing = False
+
+        self._update_dirty_bars()
+
+    def _update_dirty_bars(self):
+        """
+        Request a repaint of only the bar strips whose height moved by a
+        visible amount or whose glow row changed since they were last painted
+        """
+        if self._bar_geometry is None:
+            self.update()
+            return
 
-        self.update()
+        margin_y = 30
+        chart_height = self.height() - margin_y * 2
+        heights = self._display_values * np.float32(chart_height / 2)
+        rows = (self._values * 15 + 0.5).astype(np.int32) * 4
+        dirty = np.flatnonzero((np.abs(heights - self._painted_heights) > 0.1)
+                               | (rows != self._painted_rows))
+        if len(dirty) == 0:
+            return
+
+        bar_x, _, bar_width = self._bar_geometry
+        strip_width = math.ceil(bar_width) + 10
+        region = QRegion()
+        for x in bar_x[dirty].tolist():
+            region += QRect(int(x) - 5, margin_y - 4, strip_width, chart_height + 8)
+        self.update(region)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -807,65 +1332,75 @@ class AnimatedWaveform(QWidget):
         margin_x = 20
         margin_y = 30
 
-        chart_width = width - margin_x * 2
         chart_height = height - margin_y * 2
-
-        bar_width = chart_width / self.num_bars * 0.7
-        bar_spacing = chart_width / self.num_bars
-
         center_y = margin_y + chart_height / 2
 
-        for i in range(self.num_bars):
-            value = self._values[i]
-
-            # Add wave effect
-            wave = math.sin(self._phase + i * 0.3) * 0.1
-            display_value = max(0.05, min(1, value + wave))
-
-            bar_height = chart_height * display_value / 2
-
-            x = margin_x + i * bar_spacing + (bar_spacing - bar_width) / 2
-
-            # Glow effect
-            glow_intensity = 0.5 + 0.5 * value
-
-            for j in range(3, 0, -1):
-                glow_color = QColor(self.color)
-                glow_color.setAlpha(int(40 * glow_intensity * (4 - j) / 3))
-
-                painter.setBrush(QBrush(glow_color))
-                painter.setPen(Qt.PenStyle.NoPen)
-
-                # Top bar
-                painter.drawRoundedRect(
-                    QRectF(x - j, center_y - bar_height - j, bar_width + j * 2, bar_height + j),
-                    2, 2
-                )
-                # Bottom bar (mirrored)
-                painter.drawRoundedRect(
-                    QRectF(x - j, center_y - j, bar_width + j * 2, bar_height + j),
-                    2, 2
-                )
-
-            # Main bars
-            bar_gradient = QLinearGradient(x, center_y - bar_height, x, center_y + bar_height)
-            bar_gradient.setColorAt(0, self.color.lighter(150))
-            bar_gradient.setColorAt(0.5, self.color)
-            bar_gradient.setColorAt(1, self.color.lighter(150))
-
-            painter.setBrush(QBrush(bar_gradient))
-            painter.setPen(Qt.PenStyle.NoPen)
-
+        # Bar x positions and width only change with the widget size
+        if self._bar_geometry is None:
+            chart_width = width - margin_x * 2
+            bar_spacing = chart_width / self.num_bars
+            bar_width = bar_spacing * 0.7
+            bar_x = (margin_x + (bar_spacing - bar_width) / 2
+                     + np.arange(self.num_bars, dtype=np.float32) * np.float32(bar_spacing))
+            self._bar_geometry = (bar_x, bar_x.tolist(), bar_width)
+        bar_x, bar_xs, bar_width = self._bar_geometry
+
+        heights = self._display_values * np.float32(chart_height / 2)
+        rows = (self._values * 15 + 0.5).astype(np.int32) * 4
+
+        # Skip bars outside the dirty region, and only record the ones whose
+        # whole strip was repainted as up to date
+        region = event.region()
+        strip_width = math.ceil(bar_width) + 10
+        if QRegion(self.rect()).subtracted(region).isEmpty():
+            visible = np.arange(self.num_bars)
+            self._painted_heights[:] = heights
+            self._painted_rows[:] = rows
+        else:
+            clip = event.rect()
+            visible = np.flatnonzero((bar_x + bar_width + 5 >= clip.left())
+                                     & (bar_x - 5 <= clip.right()))
+            for i in visible.tolist():
+                strip = QRegion(int(bar_x[i]) - 5, margin_y - 4, strip_width, chart_height + 8)
+                if strip.subtracted(region).isEmpty():
+                    self._painted_heights[i] = heights[i]
+                    self._painted_rows[i] = rows[i]
+
+        bar_xs = bar_x[visible].tolist()
+        bar_heights = heights[visible].tolist()
+        row_offsets = rows[visible].tolist()
+
+        # Glow effect: blit each bar's top falloff and stretched body from
+        # the pre-rendered atlas, all in a single call
+        if self._glow_atlas is None:
+            self._glow_atlas = self._build_glow_atlas(bar_width)
+
+        # Fragment source rects are in device pixels; scale them back down
+        dpr = self._glow_atlas.devicePixelRatio()
+        atlas_width = self._glow_atlas.width()
+        half_width = atlas_width / dpr / 2
+        scale = 1 / dpr
+
+        fragments = []
+        for x, row, bar_height in zip(bar_xs, row_offsets, bar_heights):
+            center_x = x - 3 + half_width
+            fragments.append(QPainter.PixmapFragment.create(
+                QPointF(center_x, center_y - bar_height - 1.5),
+                QRectF(0, row * dpr, atlas_width, 3 * dpr), scale, scale))
+            fragments.append(QPainter.PixmapFragment.create(
+                QPointF(center_x, center_y),
+                QRectF(0, (row + 3) * dpr, atlas_width, dpr), scale, bar_height * 2 * scale))
+        painter.drawPixmapFragments(fragments, self._glow_atlas)
+
+        # Main bars: top and bottom halves share one gradient fill
+        for x, bar_height in zip(bar_xs, bar_heights):
+            path = QPainterPath()
             # Top bar
-            painter.drawRoundedRect(
-                QRectF(x, center_y - bar_height, bar_width, bar_height),
-                2, 2
-            )
+            path.addRoundedRect(QRectF(x, center_y - bar_height, bar_width, bar_height), 2, 2)
             # Bottom bar
-            painter.drawRoundedRect(
-                QRectF(x, center_y, bar_width, bar_height),
-                2, 2
-            )
+            path.addRoundedRect(QRectF(x, center_y, bar_width, bar_height), 2, 2)
+
+            painter.fillPath(path, self._bar_brush)
 
         # Center line
         painter.setPen(QPen(QColor(self.color.red(), self.color.green(),
@@ -877,11 +1412,40 @@ class AnimatedWaveform(QWidget):
         painter.setPen(QPen(self.color))
         painter.drawText(QRectF(0, 5, width, 20), Qt.AlignmentFlag.AlignCenter, self.title)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bar_geometry = None
+        self._glow_atlas = None
+        self._painted_heights[:] = -1
+
 
 # ============================================================================
 # DEMO DASHBOARD
 # ============================================================================
 
+# Dark theme, applied once to the whole application in main()
+DARK_STYLESHEET = """
+    QMainWindow {
+        background-color: #0a0e14;
+    }
+    QWidget {
+        background-color: #0a0e14;
+        color: #e0e0e0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #2a3040;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #12161c;
+    }
+    QGroupBox::title {
+        color: #00d4ff;
+    }
+"""
+
+
 class AdvancedVisualizationDashboard(QMainWindow):
     """
     Demo dashboard showing all advanced visualizations
@@ -893,28 +1457,6 @@ class AdvancedVisualizationDashboard(QMainWindow):
         self.setWindowTitle("Advanced Animated Visualizations")
         self.setGeometry(100, 100, 1400, 900)
 
-        # Dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0a0e14;
-            }
-            QWidget {
-                background-color: #0a0e14;
-                color: #e0e0e0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #2a3040;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #12161c;
-            }
-            QGroupBox::title {
-                color: #00d4ff;
-            }
-        """)
-
         # Central widget
         central = QWidget()
         self.setCentralWidget(central)
@@ -1000,41 +1542,55 @@ class AdvancedVisualizationDashboard(QMainWindow):
 
     def start_simulation(self):
         """Start data simulation"""
+        # One generator and one batched draw per tick for all scalar values:
+        # 5 radar categories followed by 4 progress rings
+        self._rng = np.random.default_rng()
+        self._sim_low = np.array([40, 60, 50, 70, 45, 30, 40, 20, 10], dtype=np.float64)
+        self._sim_high = np.array([90, 95, 85, 99, 80, 80, 70, 60, 90], dtype=np.float64)
+        self._heatmap_arr = np.empty((7, 24), dtype=np.float32)
+
         self.sim_timer = QTimer(self)
         self.sim_timer.timeout.connect(self.update_data)
         self.sim_timer.start(100)
 
     def update_data(self):
         """Update all visualizations with simulated data"""
+        vals = self._rng.uniform(self._sim_low, self._sim_high).tolist()
+
         # Radar
         self.radar_chart.setValues({
-            "Speed": random.uniform(40, 90),
-            "Accuracy": random.uniform(60, 95),
-            "Efficiency": random.uniform(50, 85),
-            "Reliability": random.uniform(70, 99),
-            "Throughput": random.uniform(45, 80),
+            "Speed": vals[0],
+            "Accuracy": vals[1],
+            "Efficiency": vals[2],
+            "Reliability": vals[3],
+            "Throughput": vals[4],
         })
 
         # Heatmap - random activity data
-        data = np.random.random((7, 24)) * 0.5
+        data = self._heatmap_arr
+        self._rng.random(dtype=np.float32, out=data)
+        data *= 0.5
         # Add some hot spots
-        data[random.randint(0, 6), random.randint(0, 23)] = random.uniform(0.7, 1.0)
+        data[self._rng.integers(0, 7), self._rng.integers(0, 24)] = self._rng.uniform(0.7, 1.0)
         self.heatmap.setData(data)
 
         # Progress rings
-        self.ring1.setValue(random.uniform(30, 80))
-        self.ring2.setValue(random.uniform(40, 70))
-        self.ring3.setValue(random.uniform(20, 60))
-        self.ring4.setValue(random.uniform(10, 90))
+        self.ring1.setValue(vals[5])
+        self.ring2.setValue(vals[6])
+        self.ring3.setValue(vals[7])
+        self.ring4.setValue(vals[8])
 
         # Waveform
         self.waveform.setRandomValues()
 
 
 def main():
+    configure_opengl()
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
+    app.setStyleSheet(DARK_STYLESHEET)
+
     dashboard = AdvancedVisualizationDashboard()
     dashboard.show()
 
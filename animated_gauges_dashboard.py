@@ -9,12 +9,274 @@ import math
 import numpy as np
 from datetime import datetime, timedelta
 from collections import deque
-import random
+from typing import NamedTuple
 
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+from frame_clock import FrameClock, IDLE_FRAME_TIME, is_showing
+
+# ============================================================================
+# DATA HELPERS
+# ============================================================================
+
+class RingBuffer:
+    """
+    Fixed-size numeric history backed by a NumPy array.
+    Each sample is stored twice, capacity apart, so the retained samples are
+    always available as one contiguous slice without copying.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64, width: int = None):
+        self.capacity = capacity
+        # With a width, each sample is a row of that many values
+        shape = (capacity * 2,) if width is None else (capacity * 2, width)
+        self._buf = np.zeros(shape, dtype=dtype)
+        self._head = 0
+        self._count = 0
+
+    def push(self, value: float):
+        """Append a sample, dropping the oldest once full"""
+        self._buf[self._head] = value
+        self._buf[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def view(self) -> np.ndarray:
+        """Samples from oldest to newest, as a view into the buffer"""
+        end = self._head + self.capacity
+        return self._buf[end - self._count:end]
+
+    def __len__(self):
+        return self._count
+
+
+class Candle(NamedTuple):
+    """One OHLC candle; a tuple, so no per-instance __dict__"""
+    open: float
+    high: float
+    low: float
+    close: float
+    timestamp: datetime
+
+
+# Pulse phases are sampled at 64 steps per cycle, so per-step paint objects
+# can be cached and frames repeat once the value settles
+PHASE_STEPS = 64
+PHASE_SIN = [math.sin(2 * math.pi * i / PHASE_STEPS) for i in range(PHASE_STEPS)]
+
+
+def _phase_step(phase: float) -> int:
+    """Quantize a phase in radians to its PHASE_STEPS table index"""
+    return int(phase * PHASE_STEPS / (2 * math.pi)) % PHASE_STEPS
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _energy_particles(n, phase, x, y, fill_width, h):
+        """
+        Positions, radii and opacity levels (0-7) of the pill gauge's energy
+        particles, ordered by level so each brush is set once
+        """
+        xs = np.empty(n)
+        ys = np.empty(n)
+        sizes = np.empty(n)
+        levels = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            xs[i] = x + (fill_width * 0.9) * ((i / n + phase / (2 * math.pi)) % 1)
+            ys[i] = y + h / 2 + math.sin(phase * 3 + i) * (h / 3)
+            sizes[i] = 2 + math.sin(phase * 2 + i * 0.5) * 1.5
+            levels[i] = int(round((1 + math.sin(phase + i)) * 3.5))
+
+        # Stable counting sort over the 8 levels
+        order = np.empty(n, dtype=np.int64)
+        k = 0
+        for level in range(8):
+            for i in range(n):
+                if levels[i] == level:
+                    order[k] = i
+                    k += 1
+        return xs[order], ys[order], sizes[order], levels[order]
+else:
+    def _energy_particles(n, phase, x, y, fill_width, h):
+        """
+        Positions, radii and opacity levels (0-7) of the pill gauge's energy
+        particles, ordered by level so each brush is set once
+        """
+        i = np.arange(n)
+        xs = x + (fill_width * 0.9) * ((i / n + phase / (2 * math.pi)) % 1)
+        ys = y + h/2 + np.sin(phase * 3 + i) * (h/3)
+        sizes = 2 + np.sin(phase * 2 + i * 0.5) * 1.5
+        levels = np.rint((1 + np.sin(phase + i)) * 3.5).astype(np.intp)
+
+        order = np.argsort(levels, kind="stable")
+        return xs[order], ys[order], sizes[order], levels[order]
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _line_points(values, y_min, y_max, x, y, w, h):
+        """
+        Screen coordinates of evenly spaced samples in the plot rect, with y
+        clamped to the rect
+        """
+        n = values.size
+        px = np.empty(n)
+        py = np.empty(n)
+        x_step = w / (n - 1)
+        y_scale = h / (y_max - y_min)
+        for i in range(n):
+            px[i] = x + x_step * i
+            py[i] = min(max(y + h - (values[i] - y_min) * y_scale, y), y + h)
+        return px, py
+else:
+    def _line_points(values, y_min, y_max, x, y, w, h):
+        """
+        Screen coordinates of evenly spaced samples in the plot rect, with y
+        clamped to the rect
+        """
+        n = len(values)
+        px = x + w * np.arange(n) / (n - 1)
+        py = y + h - h * (values - y_min) / (y_max - y_min)
+        np.clip(py, y, y + h, out=py)
+        return px, py
+
+
+def _tick_lines(cx, cy, inner_r, outer_r, start_deg, end_deg, count):
+    """Radial tick segments for count + 1 evenly spaced angles, in degrees counter-clockwise"""
+    angles = np.radians(np.linspace(start_deg, end_deg, count + 1))
+    cos_a = np.cos(angles)
+    sin_a = -np.sin(angles)  # screen y points down
+    return [QLineF(cx + inner_r * c, cy + inner_r * s, cx + outer_r * c, cy + outer_r * s)
+            for c, s in zip(cos_a.tolist(), sin_a.tolist())]
+
+
+def _chart_background_brush(top: QColor, bottom: QColor) -> QBrush:
+    """Vertical gradient brush that spans whatever shape it fills"""
+    gradient = QLinearGradient(0, 0, 0, 1)
+    gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+    gradient.setColorAt(0, top)
+    gradient.setColorAt(1, bottom)
+    return QBrush(gradient)
+
+
+def _polygon_from_arrays(xs: np.ndarray, ys: np.ndarray) -> QPolygonF:
+    """
+    QPolygonF written straight from coordinate arrays through its point
+    buffer, without building a QPointF per point
+    """
+    n = len(xs)
+    polygon = QPolygonF()
+    polygon.resize(n)
+    buf = polygon.data()
+    buf.setsize(n * 2 * 8)  # n (x, y) pairs of doubles
+    coords = np.frombuffer(buf, dtype=np.float64)
+    coords[0::2] = xs
+    coords[1::2] = ys
+    return polygon
+
+
+# ============================================================================
+# COLOR SCHEMES
+# ============================================================================
+
+# Shared by every gauge instance; paint code copies a color before changing it
+PILL_COLOR_SCHEMES = {
+    "gold": {
+        "primary": QColor(255, 215, 0),
+        "secondary": QColor(255, 180, 0),
+        "glow": QColor(255, 230, 100),
+        "bg_start": QColor(80, 60, 20),
+        "bg_end": QColor(40, 30, 10),
+    },
+    "red": {
+        "primary": QColor(220, 50, 50),
+        "secondary": QColor(150, 30, 30),
+        "glow": QColor(255, 100, 100),
+        "bg_start": QColor(60, 20, 20),
+        "bg_end": QColor(30, 10, 10),
+    },
+    "blue": {
+        "primary": QColor(100, 180, 255),
+        "secondary": QColor(50, 120, 200),
+        "glow": QColor(150, 200, 255),
+        "bg_start": QColor(20, 40, 80),
+        "bg_end": QColor(10, 20, 40),
+    },
+    "green": {
+        "primary": QColor(50, 255, 150),
+        "secondary": QColor(30, 200, 100),
+        "glow": QColor(100, 255, 180),
+        "bg_start": QColor(20, 60, 40),
+        "bg_end": QColor(10, 30, 20),
+    },
+    "purple": {
+        "primary": QColor(180, 100, 255),
+        "secondary": QColor(120, 50, 200),
+        "glow": QColor(200, 150, 255),
+        "bg_start": QColor(50, 20, 80),
+        "bg_end": QColor(25, 10, 40),
+    },
+    "cyan": {
+        "primary": QColor(0, 255, 255),
+        "secondary": QColor(0, 200, 200),
+        "glow": QColor(100, 255, 255),
+        "bg_start": QColor(20, 60, 60),
+        "bg_end": QColor(10, 30, 30),
+    },
+}
+
+CIRCULAR_COLOR_SCHEMES = {
+    "cyan": {
+        "primary": QColor(0, 255, 255),
+        "secondary": QColor(0, 180, 200),
+        "glow": QColor(100, 255, 255),
+        "bg": QColor(20, 40, 50),
+    },
+    "orange": {
+        "primary": QColor(255, 165, 0),
+        "secondary": QColor(200, 120, 0),
+        "glow": QColor(255, 200, 100),
+        "bg": QColor(50, 35, 20),
+    },
+    "green": {
+        "primary": QColor(0, 255, 100),
+        "secondary": QColor(0, 180, 80),
+        "glow": QColor(100, 255, 150),
+        "bg": QColor(20, 50, 30),
+    },
+    "red": {
+        "primary": QColor(255, 50, 50),
+        "secondary": QColor(200, 30, 30),
+        "glow": QColor(255, 100, 100),
+        "bg": QColor(50, 20, 20),
+    },
+    "purple": {
+        "primary": QColor(200, 100, 255),
+        "secondary": QColor(150, 50, 200),
+        "glow": QColor(220, 150, 255),
+        "bg": QColor(40, 20, 60),
+    },
+}
+
+# Volume chart bar colors by asset
+ASSET_COLORS = {
+    "BTC": QColor(247, 147, 26),   # orange
+    "ETH": QColor(98, 126, 234),   # blue
+    "SOL": QColor(0, 255, 163),    # green
+    "ADA": QColor(0, 51, 173),     # blue
+    "DOT": QColor(230, 0, 122),    # pink
+}
+
+
 # ============================================================================
 # ANIMATED GAUGE WIDGETS
 # ============================================================================
@@ -41,6 +303,7 @@ class AnimatedPillGauge(QWidget):
         self.max_value = max_value
         self.unit = unit
         self.color_scheme = color_scheme
+        self.color_schemes = PILL_COLOR_SCHEMES
 
         # Current and target values for animation
         self._current_value = min_value
@@ -52,78 +315,67 @@ class AnimatedPillGauge(QWidget):
         self._pulse_phase = 0.0
         self._particle_phase = 0.0
 
-        # Color schemes
-        self.color_schemes = {
-            "gold": {
-                "primary": QColor(255, 215, 0),
-                "secondary": QColor(255, 180, 0),
-                "glow": QColor(255, 230, 100),
-                "bg_start": QColor(80, 60, 20),
-                "bg_end": QColor(40, 30, 10),
-            },
-            "red": {
-                "primary": QColor(220, 50, 50),
-                "secondary": QColor(150, 30, 30),
-                "glow": QColor(255, 100, 100),
-                "bg_start": QColor(60, 20, 20),
-                "bg_end": QColor(30, 10, 10),
-            },
-            "blue": {
-                "primary": QColor(100, 180, 255),
-                "secondary": QColor(50, 120, 200),
-                "glow": QColor(150, 200, 255),
-                "bg_start": QColor(20, 40, 80),
-                "bg_end": QColor(10, 20, 40),
-            },
-            "green": {
-                "primary": QColor(50, 255, 150),
-                "secondary": QColor(30, 200, 100),
-                "glow": QColor(100, 255, 180),
-                "bg_start": QColor(20, 60, 40),
-                "bg_end": QColor(10, 30, 20),
-            },
-            "purple": {
-                "primary": QColor(180, 100, 255),
-                "secondary": QColor(120, 50, 200),
-                "glow": QColor(200, 150, 255),
-                "bg_start": QColor(50, 20, 80),
-                "bg_end": QColor(25, 10, 40),
-            },
-            "cyan": {
-                "primary": QColor(0, 255, 255),
-                "secondary": QColor(0, 200, 200),
-                "glow": QColor(100, 255, 255),
-                "bg_start": QColor(20, 60, 60),
-                "bg_end": QColor(10, 30, 30),
-            },
-        }
+
+        # Frame and gauge background, rendered once per size
+        self._static_cache = None
+        self._pill_clip_path = None
+
+        # Particle brushes for 8 quantized opacity levels, built on first use
+        self._particle_brushes = None
+
+        # Pre-composited right edge of the fill glow, built on first use
+        self._glow_sprite = None
+
+        # (fill brush, core brush) per pulse step, built on first use
+        self._fill_brushes = [None] * PHASE_STEPS
+
+        # Paint objects reused every frame
+        self._title_font = QFont("Arial", 11, QFont.Weight.Bold)
+        self._subtitle_font = QFont("Arial", 8)
+        self._value_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._subtitle_color = QColor(180, 180, 180)
+
+        highlight_gradient = QLinearGradient(0, 0, 0, 1)
+        highlight_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+        highlight_gradient.setColorAt(0, QColor(255, 255, 255, 80))
+        highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        self._highlight_brush = QBrush(highlight_gradient)
 
         # Setup widget
         self.setMinimumSize(300, 80)
         self.setMaximumHeight(100)
 
-        # Animation timer
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)  # ~60 FPS
-
-        # Value animation timer
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_value)
-        self.value_timer.start(16)
+        # Animation driven by the shared frame clock
+        self._easing = False
+        self._pending_dt = 0.0
+        FrameClock.instance().attach(self, self._animate)
 
     def setValue(self, value: float):
         """Set the target value with animation"""
         self._target_value = max(self.min_value, min(self.max_value, value))
+        self._easing = True
 
     def value(self) -> float:
         return self._current_value
 
-    def _animate(self):
-        """Update animation phases"""
-        self._glow_phase += 0.05
-        self._pulse_phase += 0.03
-        self._particle_phase += 0.02
+    def _animate(self, dt: float):
+        """Update animation phases and ease the value"""
+        if not is_showing(self):
+            # value() feeds the charts, so keep easing while off screen
+            if self._easing:
+                self._animate_value(dt * 60)
+            return
+
+        # Once the value has settled only the glow moves, which needs ~15 fps
+        self._pending_dt += dt
+        if not self._easing and self._pending_dt < IDLE_FRAME_TIME:
+            return
+        dt, self._pending_dt = self._pending_dt, 0.0
+
+        step = dt * 60  # frames elapsed at 60 fps
+        self._glow_phase += 0.05 * step
+        self._pulse_phase += 0.03 * step
+        self._particle_phase += 0.02 * step
 
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
@@ -132,14 +384,20 @@ class AnimatedPillGauge(QWidget):
         if self._particle_phase > 2 * math.pi:
             self._particle_phase -= 2 * math.pi
 
+        if self._easing:
+            self._animate_value(step)
+
         self.update()
 
-    def _animate_value(self):
+    def _animate_value(self, step: float):
         """Smoothly animate value changes"""
         diff = self._target_value - self._display_value
         if abs(diff) > 0.01:
-            self._display_value += diff * 0.1
+            self._display_value += diff * (1 - 0.9 ** step)
             self._current_value = self._display_value
+        else:
+            # Value has settled; setValue() resumes easing
+            self._easing = False
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -158,31 +416,59 @@ class AnimatedPillGauge(QWidget):
         gauge_width = width - 140
         gauge_height = 40
 
-        # Draw outer frame (steampunk style)
-        self._draw_frame(painter, gauge_x - 10, gauge_y - 5, gauge_width + 20, gauge_height + 10, colors)
+        # Skip layers outside the region being repainted
+        region = event.region()
+        frame_rect = QRect(gauge_x - 11, gauge_y - 6, gauge_width + 22, gauge_height + 12)
+        title_rect = QRect(0, 0, gauge_x - 10, height)
+        value_rect = QRect(gauge_x + gauge_width + 10, 0, 50, height)
 
-        # Draw gauge background
-        self._draw_gauge_background(painter, gauge_x, gauge_y, gauge_width, gauge_height, colors)
+        if region.intersects(frame_rect):
+            # Draw cached frame and gauge background
+            if self._static_cache is None:
+                self._static_cache = self._build_static_cache(gauge_x, gauge_y, gauge_width, gauge_height, colors)
+            painter.drawPixmap(0, 0, self._static_cache)
 
-        # Draw fill with glow
-        fill_percentage = (self._display_value - self.min_value) / (self.max_value - self.min_value)
-        self._draw_gauge_fill(painter, gauge_x, gauge_y, gauge_width, gauge_height, fill_percentage, colors)
+            # Draw fill with glow
+            fill_percentage = (self._display_value - self.min_value) / (self.max_value - self.min_value)
+            self._draw_gauge_fill(painter, gauge_x, gauge_y, gauge_width, gauge_height, fill_percentage, colors)
 
-        # Draw particles/energy effect
-        self._draw_energy_particles(painter, gauge_x, gauge_y, gauge_width, gauge_height, fill_percentage, colors)
+            # Draw particles/energy effect
+            self._draw_energy_particles(painter, gauge_x, gauge_y, gauge_width, gauge_height, fill_percentage, colors)
 
-        # Draw glass overlay
-        self._draw_glass_overlay(painter, gauge_x, gauge_y, gauge_width, gauge_height)
+            # Draw glass overlay
+            self._draw_glass_overlay(painter, gauge_x, gauge_y, gauge_width, gauge_height)
 
         # Draw title and value
-        self._draw_labels(painter, gauge_x, gauge_y, gauge_width, gauge_height, colors)
+        if region.intersects(title_rect) or region.intersects(value_rect):
+            self._draw_labels(painter, gauge_x, gauge_y, gauge_width, gauge_height, colors)
+
+        # The first _energy_particles call compiles under numba and leaves a
+        # reference cycle holding this frame, so don't rely on refcounting
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache = None
+        self._pill_clip_path = None
+
+    def _build_static_cache(self, gauge_x, gauge_y, gauge_w, gauge_h, colors):
+        """Render the size-dependent frame and gauge background into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Outer frame (steampunk style)
+        self._draw_frame(painter, gauge_x - 10, gauge_y - 5, gauge_w + 20, gauge_h + 10, colors)
+        self._draw_gauge_background(painter, gauge_x, gauge_y, gauge_w, gauge_h, colors)
+        painter.end()
+
+        return cache
 
     def _draw_frame(self, painter, x, y, w, h, colors):
         """Draw steampunk-style frame"""
-        # Outer border
-        frame_path = QPainterPath()
-        frame_path.addRoundedRect(QRectF(x, y, w, h), h/2, h/2)
-
         # Bronze/copper gradient for frame
         frame_gradient = QLinearGradient(x, y, x, y + h)
         frame_gradient.setColorAt(0, QColor(139, 90, 43))
@@ -193,20 +479,15 @@ class AnimatedPillGauge(QWidget):
 
         painter.setBrush(QBrush(frame_gradient))
         painter.setPen(QPen(QColor(80, 50, 20), 2))
-        painter.drawPath(frame_path)
+        painter.drawRoundedRect(QRectF(x, y, w, h), h/2, h/2)
 
         # Inner shadow
-        inner_shadow = QPainterPath()
-        inner_shadow.addRoundedRect(QRectF(x + 3, y + 3, w - 6, h - 6), (h-6)/2, (h-6)/2)
-        painter.setBrush(QBrush(QColor(0, 0, 0, 100)))
+        painter.setBrush(QColor(0, 0, 0, 100))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(inner_shadow)
+        painter.drawRoundedRect(QRectF(x + 3, y + 3, w - 6, h - 6), (h-6)/2, (h-6)/2)
 
     def _draw_gauge_background(self, painter, x, y, w, h, colors):
         """Draw gauge background with gradient"""
-        bg_path = QPainterPath()
-        bg_path.addRoundedRect(QRectF(x, y, w, h), h/2, h/2)
-
         # Dark gradient background
         bg_gradient = QLinearGradient(x, y, x, y + h)
         bg_gradient.setColorAt(0, colors["bg_start"])
@@ -215,7 +496,7 @@ class AnimatedPillGauge(QWidget):
 
         painter.setBrush(QBrush(bg_gradient))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(bg_path)
+        painter.drawRoundedRect(QRectF(x, y, w, h), h/2, h/2)
 
     def _draw_gauge_fill(self, painter, x, y, w, h, percentage, colors):
         """Draw animated fill with glow effect"""
@@ -224,25 +505,52 @@ class AnimatedPillGauge(QWidget):
 
         fill_width = w * percentage
 
-        # Create clipping path for pill shape
-        clip_path = QPainterPath()
-        clip_path.addRoundedRect(QRectF(x, y, w, h), h/2, h/2)
-        painter.setClipPath(clip_path)
+        # Clip to pill shape
+        painter.setClipPath(self._pill_clip(x, y, w, h))
 
         # Pulsing glow intensity
-        glow_intensity = 0.7 + 0.3 * math.sin(self._pulse_phase)
-
-        # Draw outer glow
-        for i in range(5, 0, -1):
-            glow_color = QColor(colors["glow"])
-            glow_color.setAlpha(int(30 * glow_intensity * (6 - i) / 5))
+        pulse_step = _phase_step(self._pulse_phase)
+        glow_intensity = 0.7 + 0.3 * PHASE_SIN[pulse_step]
+
+        # Draw outer glow: inside the pill every layer covers everything left
+        # of the fill's end cap, so stretch the sprite's first column up to
+        # the cap center and blit the falloff after it
+        if self._glow_sprite is None:
+            self._glow_sprite = self._build_glow_sprite(h, colors)
+        sprite = self._glow_sprite
+        cap_x = x + fill_width - h/2
+
+        painter.setOpacity(glow_intensity)
+        if cap_x > x:
+            painter.drawPixmap(QRectF(x, y - 5, cap_x - x, h + 10), sprite, QRectF(0, 0, 1, sprite.height()))
+        painter.drawPixmap(QPointF(cap_x, y - 5), sprite)
+        painter.setOpacity(1.0)
+        painter.setPen(Qt.PenStyle.NoPen)
 
-            glow_rect = QRectF(x - i, y - i, fill_width + i * 2, h + i * 2)
-            painter.setBrush(QBrush(glow_color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(glow_rect, (h + i * 2) / 2, (h + i * 2) / 2)
+        if self._fill_brushes[pulse_step] is None:
+            self._fill_brushes[pulse_step] = self._make_fill_brushes(x, y, h, glow_intensity, colors)
+        fill_brush, core_brush = self._fill_brushes[pulse_step]
 
         # Main fill gradient
+        fill_rect = QRectF(x, y, fill_width, h)
+        painter.setBrush(fill_brush)
+        painter.drawRoundedRect(fill_rect, h/2, h/2)
+
+        # Center bright line (energy core)
+        painter.setBrush(core_brush)
+        painter.drawRect(QRectF(x + h/4, y + h/2 - 4, fill_width - h/2, 8))
+
+        painter.setClipping(False)
+
+    def _pill_clip(self, x, y, w, h):
+        """Pill-shaped clip path, built once per size"""
+        if self._pill_clip_path is None:
+            self._pill_clip_path = QPainterPath()
+            self._pill_clip_path.addRoundedRect(QRectF(x, y, w, h), h/2, h/2)
+        return self._pill_clip_path
+
+    def _make_fill_brushes(self, x, y, h, glow_intensity, colors):
+        """Build the main fill and energy core gradient brushes for one pulse step"""
         fill_gradient = QLinearGradient(x, y, x, y + h)
 
         primary_bright = QColor(colors["primary"])
@@ -254,21 +562,38 @@ class AnimatedPillGauge(QWidget):
         fill_gradient.setColorAt(0.7, primary_bright)
         fill_gradient.setColorAt(1, colors["secondary"])
 
-        fill_rect = QRectF(x, y, fill_width, h)
-        painter.setBrush(QBrush(fill_gradient))
-        painter.drawRoundedRect(fill_rect, h/2, h/2)
-
-        # Center bright line (energy core)
         center_gradient = QLinearGradient(x, y + h/2 - 3, x, y + h/2 + 3)
         bright_core = QColor(255, 255, 255, int(200 * glow_intensity))
         center_gradient.setColorAt(0, QColor(255, 255, 255, 0))
         center_gradient.setColorAt(0.5, bright_core)
         center_gradient.setColorAt(1, QColor(255, 255, 255, 0))
 
-        painter.setBrush(QBrush(center_gradient))
-        painter.drawRect(QRectF(x + h/4, y + h/2 - 4, fill_width - h/2, 8))
+        return QBrush(fill_gradient), QBrush(center_gradient)
 
-        painter.setClipping(False)
+    def _build_glow_sprite(self, h, colors):
+        """
+        Composite the 5 inflated glow layers at full intensity, from the
+        center of the fill's rounded end to the outermost layer's edge
+        """
+        dpr = self.devicePixelRatioF()
+        sprite = QPixmap(math.ceil((math.ceil(h/2) + 5) * dpr), math.ceil((h + 10) * dpr))
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for i in range(5, 0, -1):
+            glow_color = QColor(colors["glow"])
+            glow_color.setAlpha(int(30 * (6 - i) / 5))
+            painter.setBrush(glow_color)
+
+            # Layer whose right cap is centered on x = 0
+            radius = h/2 + i
+            painter.drawRoundedRect(QRectF(-3 * radius, 5 - i, 4 * radius, h + i * 2), radius, radius)
+        painter.end()
+
+        return sprite
 
     def _draw_energy_particles(self, painter, x, y, w, h, percentage, colors):
         """Draw animated energy particles"""
@@ -277,65 +602,58 @@ class AnimatedPillGauge(QWidget):
 
         fill_width = w * percentage
 
-        # Create clipping path
-        clip_path = QPainterPath()
-        clip_path.addRoundedRect(QRectF(x, y, fill_width, h), h/2, h/2)
-        painter.setClipPath(clip_path)
+        # Clip to the whole pill; particles stay within 90% of the fill width
+        painter.setClipPath(self._pill_clip(x, y, w, h))
 
-        # Draw particles
-        num_particles = int(20 * percentage)
-        for i in range(num_particles):
-            # Particle position based on phase
-            particle_x = x + (fill_width * 0.9) * ((i / num_particles + self._particle_phase / (2 * math.pi)) % 1)
-            particle_y = y + h/2 + math.sin(self._particle_phase * 3 + i) * (h/3)
+        if self._particle_brushes is None:
+            self._particle_brushes = []
+            for level in range(8):
+                particle_color = QColor(colors["glow"])
+                particle_color.setAlpha(round(200 * level / 7))
+                self._particle_brushes.append(QBrush(particle_color))
 
-            # Particle size and opacity
-            size = 2 + math.sin(self._particle_phase * 2 + i * 0.5) * 1.5
-            opacity = 100 + int(100 * math.sin(self._particle_phase + i))
+        # Particle positions, sizes and opacity levels based on phase
+        xs, ys, sizes, levels = _energy_particles(int(20 * percentage), self._particle_phase,
+                                                  x, y, fill_width, h)
 
-            particle_color = QColor(colors["glow"])
-            particle_color.setAlpha(opacity)
-
-            painter.setBrush(QBrush(particle_color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(particle_x, particle_y), size, size)
+        # Draw particles grouped by opacity level, one brush change per level
+        painter.setPen(Qt.PenStyle.NoPen)
+        current_level = -1
+        for px, py, size, level in zip(xs.tolist(), ys.tolist(), sizes.tolist(), levels.tolist()):
+            if level != current_level:
+                painter.setBrush(self._particle_brushes[level])
+                current_level = level
+            painter.drawEllipse(QPointF(px, py), size, size)
 
         painter.setClipping(False)
 
     def _draw_glass_overlay(self, painter, x, y, w, h):
         """Draw glass/reflection overlay"""
         # Top highlight
-        highlight_path = QPainterPath()
-        highlight_path.addRoundedRect(QRectF(x + 5, y + 3, w - 10, h/3), h/6, h/6)
-
-        highlight_gradient = QLinearGradient(x, y, x, y + h/3)
-        highlight_gradient.setColorAt(0, QColor(255, 255, 255, 80))
-        highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
-
-        painter.setBrush(QBrush(highlight_gradient))
+        painter.setBrush(self._highlight_brush)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(highlight_path)
+        painter.drawRoundedRect(QRectF(x + 5, y + 3, w - 10, h/3), h/6, h/6)
 
     def _draw_labels(self, painter, gauge_x, gauge_y, gauge_w, gauge_h, colors):
         """Draw title, subtitle, and value labels"""
         # Title (left side)
-        painter.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        painter.setPen(QPen(colors["primary"]))
+        painter.setFont(self._title_font)
+        painter.setPen(colors["primary"])
 
         title_rect = QRect(5, gauge_y, gauge_x - 15, gauge_h)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, self.title)
 
         # Subtitle (below title if exists)
         if self.subtitle:
-            painter.setFont(QFont("Arial", 8))
-            painter.setPen(QPen(QColor(180, 180, 180)))
+            painter.setFont(self._subtitle_font)
+            painter.setPen(self._subtitle_color)
             subtitle_rect = QRect(5, gauge_y + gauge_h, gauge_x - 15, 20)
             painter.drawText(subtitle_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, self.subtitle)
 
         # Value (right side)
         value_text = f"{self._display_value:.1f}{self.unit}"
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.setPen(QPen(colors["glow"]))
+        painter.setFont(self._value_font)
+        painter.setPen(colors["glow"])
 
         value_rect = QRect(gauge_x + gauge_w + 10, gauge_y, 50, gauge_h)
         painter.drawText(value_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, value_text)
@@ -368,73 +686,84 @@ class AnimatedCircularGauge(QWidget):
         self._rotation_phase = 0.0
         self._glow_phase = 0.0
 
-        # Color schemes
-        self.color_schemes = {
-            "cyan": {
-                "primary": QColor(0, 255, 255),
-                "secondary": QColor(0, 180, 200),
-                "glow": QColor(100, 255, 255),
-                "bg": QColor(20, 40, 50),
-            },
-            "orange": {
-                "primary": QColor(255, 165, 0),
-                "secondary": QColor(200, 120, 0),
-                "glow": QColor(255, 200, 100),
-                "bg": QColor(50, 35, 20),
-            },
-            "green": {
-                "primary": QColor(0, 255, 100),
-                "secondary": QColor(0, 180, 80),
-                "glow": QColor(100, 255, 150),
-                "bg": QColor(20, 50, 30),
-            },
-            "red": {
-                "primary": QColor(255, 50, 50),
-                "secondary": QColor(200, 30, 30),
-                "glow": QColor(255, 100, 100),
-                "bg": QColor(50, 20, 20),
-            },
-            "purple": {
-                "primary": QColor(200, 100, 255),
-                "secondary": QColor(150, 50, 200),
-                "glow": QColor(220, 150, 255),
-                "bg": QColor(40, 20, 60),
-            },
-        }
+        # Background and ticks, rendered once per size
+        self._static_cache = None
 
-        self.setMinimumSize(180, 200)
+        # Single-stroke arc glow pen and its end cap gradient, rebuilt after a resize
+        self._glow_pen = None
+        self._glow_cap = None
+
+        # Main arc pen and the fill percentage it was built for
+        self._arc_pen = None
+        self._arc_pen_key = None
 
-        # Animation timers
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Paint objects reused every frame
+        self._value_font = QFont("Arial", 16, QFont.Weight.Bold)
+        self._unit_font = QFont("Arial", 10)
+        self._title_font = QFont("Arial", 11, QFont.Weight.Bold)
+        self._unit_color = QColor(180, 180, 190)
+        self._hub_pen = QPen(QColor(100, 100, 110), 2)
+        self._inner_color = QColor()
+        self._dot_color = QColor()
 
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_value)
-        self.value_timer.start(16)
+        # Hub gradient relative to the hub's bounding box, so it follows resizes
+        hub_gradient = QRadialGradient(0.5, 0.4, 0.5)
+        hub_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+        hub_gradient.setColorAt(0, QColor(80, 80, 90))
+        hub_gradient.setColorAt(0.5, QColor(50, 50, 60))
+        hub_gradient.setColorAt(1, QColor(30, 30, 40))
+        self._hub_brush = QBrush(hub_gradient)
+
+        self.color_schemes = CIRCULAR_COLOR_SCHEMES
+
+        self.setMinimumSize(180, 200)
+
+        # Animation driven by the shared frame clock
+        self._easing = False
+        self._pending_dt = 0.0
+        FrameClock.instance().attach(self, self._animate)
 
     def setValue(self, value: float):
         self._target_value = max(self.min_value, min(self.max_value, value))
+        self._easing = True
 
     def value(self) -> float:
         return self._current_value
 
-    def _animate(self):
-        self._rotation_phase += 0.02
-        self._glow_phase += 0.05
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            # value() feeds the charts, so keep easing while off screen
+            if self._easing:
+                self._animate_value(dt * 60)
+            return
+
+        # Once the value has settled only the glow moves, which needs ~15 fps
+        self._pending_dt += dt
+        if not self._easing and self._pending_dt < IDLE_FRAME_TIME:
+            return
+        dt, self._pending_dt = self._pending_dt, 0.0
+
+        step = dt * 60  # frames elapsed at 60 fps
+        self._rotation_phase += 0.02 * step
+        self._glow_phase += 0.05 * step
 
         if self._rotation_phase > 2 * math.pi:
             self._rotation_phase -= 2 * math.pi
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
 
+        if self._easing:
+            self._animate_value(step)
+
         self.update()
 
-    def _animate_value(self):
+    def _animate_value(self, step: float):
         diff = self._target_value - self._display_value
         if abs(diff) > 0.01:
-            self._display_value += diff * 0.08
+            self._display_value += diff * (1 - 0.92 ** step)
             self._current_value = self._display_value
+        else:
+            self._easing = False
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -450,30 +779,64 @@ class AnimatedCircularGauge(QWidget):
         center_y = height / 2 - 10
         radius = min(width, height) / 2 - 30
 
-        # Draw background circle
-        self._draw_background(painter, center_x, center_y, radius, colors)
-
-        # Draw tick marks
-        self._draw_ticks(painter, center_x, center_y, radius, colors)
-
-        # Draw arc fill
-        percentage = (self._display_value - self.min_value) / (self.max_value - self.min_value)
-        self._draw_arc_fill(painter, center_x, center_y, radius, percentage, colors)
+        # Skip layers outside the region being repainted: the dial (including
+        # the arc glow), the ring of rotating dots and the title below
+        region = event.region()
+        dial_rect = QRectF(center_x - radius - 7, center_y - radius - 7,
+                           (radius + 7) * 2, (radius + 7) * 2).toAlignedRect()
+        dots_rect = QRectF(center_x - radius - 16, center_y - radius - 16,
+                           (radius + 16) * 2, (radius + 16) * 2).toAlignedRect()
+        title_rect = QRectF(center_x - 60, center_y + radius + 15, 120, 20).toAlignedRect()
+
+        if region.intersects(dial_rect):
+            # Draw cached background circle and tick marks
+            if self._static_cache is None:
+                self._static_cache = self._build_static_cache(center_x, center_y, radius, colors)
+            painter.drawPixmap(0, 0, self._static_cache)
+
+            # Draw arc fill
+            percentage = (self._display_value - self.min_value) / (self.max_value - self.min_value)
+            self._draw_arc_fill(painter, center_x, center_y, radius, percentage, colors)
 
         # Draw rotating elements
-        self._draw_rotating_elements(painter, center_x, center_y, radius, colors)
+        if region.intersects(dots_rect):
+            self._draw_rotating_elements(painter, center_x, center_y, radius, colors)
 
-        # Draw center
-        self._draw_center(painter, center_x, center_y, radius, colors)
+        if region.intersects(dial_rect):
+            # Draw center
+            self._draw_center(painter, center_x, center_y, radius, colors)
 
         # Draw labels
-        self._draw_labels(painter, center_x, center_y, radius, colors)
+        if region.intersects(dial_rect) or region.intersects(title_rect):
+            self._draw_labels(painter, center_x, center_y, radius, colors)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache = None
+        self._glow_pen = None
+        self._glow_cap = None
+        self._arc_pen_key = None
+
+    def _build_static_cache(self, cx, cy, r, colors):
+        """Render the size-dependent background and tick marks into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(painter, cx, cy, r, colors)
+        self._draw_ticks(painter, cx, cy, r, colors)
+        painter.end()
+
+        return cache
 
     def _draw_background(self, painter, cx, cy, r, colors):
         """Draw gauge background"""
         # Outer ring
         painter.setPen(QPen(QColor(60, 60, 70), 3))
-        painter.setBrush(QBrush(colors["bg"]))
+        painter.setBrush(colors["bg"])
         painter.drawEllipse(QPointF(cx, cy), r + 5, r + 5)
 
         # Inner dark area
@@ -490,42 +853,17 @@ class AnimatedCircularGauge(QWidget):
         """Draw tick marks around the gauge"""
         start_angle = 225  # degrees
         end_angle = -45
-        total_angle = start_angle - end_angle
 
         num_major_ticks = 10
         num_minor_ticks = 50
 
         # Minor ticks
         painter.setPen(QPen(QColor(80, 80, 90), 1))
-        for i in range(num_minor_ticks + 1):
-            angle_deg = start_angle - (total_angle * i / num_minor_ticks)
-            angle_rad = math.radians(angle_deg)
-
-            inner_r = r - 15
-            outer_r = r - 10
-
-            x1 = cx + inner_r * math.cos(angle_rad)
-            y1 = cy - inner_r * math.sin(angle_rad)
-            x2 = cx + outer_r * math.cos(angle_rad)
-            y2 = cy - outer_r * math.sin(angle_rad)
-
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLines(_tick_lines(cx, cy, r - 15, r - 10, start_angle, end_angle, num_minor_ticks))
 
         # Major ticks
         painter.setPen(QPen(colors["primary"], 2))
-        for i in range(num_major_ticks + 1):
-            angle_deg = start_angle - (total_angle * i / num_major_ticks)
-            angle_rad = math.radians(angle_deg)
-
-            inner_r = r - 20
-            outer_r = r - 8
-
-            x1 = cx + inner_r * math.cos(angle_rad)
-            y1 = cy - inner_r * math.sin(angle_rad)
-            x2 = cx + outer_r * math.cos(angle_rad)
-            y2 = cy - outer_r * math.sin(angle_rad)
-
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLines(_tick_lines(cx, cy, r - 20, r - 8, start_angle, end_angle, num_major_ticks))
 
     def _draw_arc_fill(self, painter, cx, cy, r, percentage, colors):
         """Draw the filled arc with glow"""
@@ -538,34 +876,80 @@ class AnimatedCircularGauge(QWidget):
         arc_rect = QRectF(cx - r + 8, cy - r + 8, (r - 8) * 2, (r - 8) * 2)
 
         # Glow intensity
-        glow_intensity = 0.7 + 0.3 * math.sin(self._glow_phase)
-
-        # Draw glow layers
-        for i in range(4, 0, -1):
-            glow_color = QColor(colors["glow"])
-            glow_color.setAlpha(int(40 * glow_intensity * (5 - i) / 4))
-
-            pen = QPen(glow_color, 12 + i * 4)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawArc(arc_rect, start_angle, span_angle)
-
-        # Main arc
-        arc_gradient = QConicalGradient(cx, cy, 225)
-        arc_gradient.setColorAt(0, colors["secondary"])
-        arc_gradient.setColorAt(percentage * 0.75, colors["primary"])
-        arc_gradient.setColorAt(percentage * 0.75, colors["glow"])
+        glow_intensity = 0.7 + 0.3 * PHASE_SIN[_phase_step(self._glow_phase)]
+
+        # Draw glow as one wide stroke with the layered falloff baked in,
+        # closed by a half-disc at each end
+        if self._glow_pen is None:
+            self._glow_pen, self._glow_cap = self._build_glow_pen(cx, cy, r - 8, colors)
+        painter.setOpacity(glow_intensity)
+        painter.setPen(self._glow_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawArc(arc_rect, start_angle, span_angle)
 
-        pen = QPen(QBrush(arc_gradient), 12)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for angle, direction in ((225, 1), (225 + span_angle / 16, -1)):
+            end_x = cx + (r - 8) * math.cos(math.radians(angle))
+            end_y = cy - (r - 8) * math.sin(math.radians(angle))
+            painter.setBrushOrigin(QPointF(end_x, end_y))
+            painter.setBrush(self._glow_cap)
+            painter.drawPie(QRectF(end_x - 14, end_y - 14, 28, 28), int(angle * 16), direction * 180 * 16)
+        painter.setBrushOrigin(QPointF(0, 0))
+        painter.setOpacity(1.0)
+
+        # Main arc; the gradient only depends on the value, so keep the pen
+        # for as long as the value holds still
+        if self._arc_pen_key != percentage:
+            arc_gradient = QConicalGradient(cx, cy, 225)
+            arc_gradient.setColorAt(0, colors["secondary"])
+            arc_gradient.setColorAt(percentage * 0.75, colors["primary"])
+            arc_gradient.setColorAt(percentage * 0.75, colors["glow"])
+
+            self._arc_pen = QPen(QBrush(arc_gradient), 12)
+            self._arc_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            self._arc_pen_key = percentage
+        painter.setPen(self._arc_pen)
         painter.drawArc(arc_rect, start_angle, span_angle)
 
+    def _build_glow_pen(self, cx, cy, arc_r, colors):
+        """
+        28 px flat-capped pen whose radial gradient reproduces the 4 stacked
+        round-capped glow strokes (16-28 px wide) composited at full intensity,
+        plus the matching brush for the end caps, centered on the origin
+        """
+        glow = colors["glow"]
+        outer_r = arc_r + 14
+
+        # Composite color where the strokes at least 2 * d px wide overlap
+        def band(d):
+            transparency = 1.0
+            for i in range(1, 5):
+                if 6 + i * 2 >= d:
+                    transparency *= 1 - int(40 * (5 - i) / 4) / 255
+            return QColor(glow.red(), glow.green(), glow.blue(), round(255 * (1 - transparency)))
+
+        # Stops at each stroke edge's midpoint, mirrored around the arc
+        stops = [(8, band(8)), (9, band(10)), (11, band(12)), (13, band(14)), (14, band(15))]
+        gradient = QRadialGradient(cx, cy, outer_r)
+        cap_gradient = QRadialGradient(0, 0, 14)
+        for d, color in stops:
+            gradient.setColorAt((arc_r - d) / outer_r, color)
+            gradient.setColorAt((arc_r + d) / outer_r, color)
+            cap_gradient.setColorAt(d / 14, color)
+
+        pen = QPen(QBrush(gradient), 28)
+        pen.setCapStyle(Qt.PenCapStyle.FlatCap)
+        return pen, QBrush(cap_gradient)
+
     def _draw_rotating_elements(self, painter, cx, cy, r, colors):
         """Draw rotating decorative elements"""
         # Rotating dots around the gauge
         num_dots = 8
+        dot_color = self._dot_color
+        dot_color.setRgb(colors["primary"].rgb())
+        dot_color.setAlpha(150)
+        painter.setBrush(dot_color)
+        painter.setPen(Qt.PenStyle.NoPen)
         for i in range(num_dots):
             base_angle = (360 / num_dots) * i
             angle_rad = math.radians(base_angle + math.degrees(self._rotation_phase))
@@ -577,54 +961,45 @@ class AnimatedCircularGauge(QWidget):
             # Pulsing size
             size = 3 + math.sin(self._glow_phase + i) * 1
 
-            dot_color = QColor(colors["primary"])
-            dot_color.setAlpha(150)
-
-            painter.setBrush(QBrush(dot_color))
-            painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(QPointF(dot_x, dot_y), size, size)
 
     def _draw_center(self, painter, cx, cy, r, colors):
         """Draw center hub"""
         # Center circle with gradient
-        center_gradient = QRadialGradient(cx, cy - 5, 25)
-        center_gradient.setColorAt(0, QColor(80, 80, 90))
-        center_gradient.setColorAt(0.5, QColor(50, 50, 60))
-        center_gradient.setColorAt(1, QColor(30, 30, 40))
-
-        painter.setBrush(QBrush(center_gradient))
-        painter.setPen(QPen(QColor(100, 100, 110), 2))
+        painter.setBrush(self._hub_brush)
+        painter.setPen(self._hub_pen)
         painter.drawEllipse(QPointF(cx, cy), 25, 25)
 
         # Inner glow
-        glow_intensity = 0.5 + 0.5 * math.sin(self._glow_phase)
-        inner_color = QColor(colors["primary"])
+        glow_intensity = 0.5 + 0.5 * PHASE_SIN[_phase_step(self._glow_phase)]
+        inner_color = self._inner_color
+        inner_color.setRgb(colors["primary"].rgb())
         inner_color.setAlpha(int(100 * glow_intensity))
 
-        painter.setBrush(QBrush(inner_color))
+        painter.setBrush(inner_color)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(QPointF(cx, cy), 15, 15)
 
     def _draw_labels(self, painter, cx, cy, r, colors):
         """Draw title and value"""
         # Value in center
-        painter.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        painter.setPen(QPen(colors["glow"]))
+        painter.setFont(self._value_font)
+        painter.setPen(colors["glow"])
 
         value_text = f"{self._display_value:.1f}"
         value_rect = QRectF(cx - 40, cy - 12, 80, 24)
         painter.drawText(value_rect, Qt.AlignmentFlag.AlignCenter, value_text)
 
         # Unit below value
-        painter.setFont(QFont("Arial", 10))
-        painter.setPen(QPen(QColor(180, 180, 190)))
+        painter.setFont(self._unit_font)
+        painter.setPen(self._unit_color)
 
         unit_rect = QRectF(cx - 30, cy + 10, 60, 16)
         painter.drawText(unit_rect, Qt.AlignmentFlag.AlignCenter, self.unit)
 
         # Title at bottom
-        painter.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        painter.setPen(QPen(colors["primary"]))
+        painter.setFont(self._title_font)
+        painter.setPen(colors["primary"])
 
         title_rect = QRectF(cx - 60, cy + r + 15, 120, 20)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
@@ -660,39 +1035,109 @@ class AnimatedSpeedometer(QWidget):
         self._glow_phase = 0.0
         self._needle_oscillation = 0.0
 
-        self.setMinimumSize(200, 220)
+        # Background, zones and scale, rendered once per size
+        self._static_cache = None
+
+        # Area covered by the needle and its shadow when last painted
+        self._needle_rect = QRectF()
+
+        # Needle and shadow outlines around the pivot, rotated into place when drawn
+        self._needle_poly = None
+        self._shadow_poly = None
+
+        # Paint objects reused every frame
+        self._shadow_brush = QBrush(QColor(0, 0, 0, 80))
+        self._needle_pen = QPen(QColor(50, 50, 50), 1)
+        self._needle_mid_color = QColor(200, 200, 200)
+        self._needle_tail_color = QColor(100, 100, 100)
+        self._needle_color = QColor()
+        self._cap_pen = QPen(QColor(60, 60, 70), 2)
+        self._cap_highlight = QColor(100, 100, 110)
+        self._display_brush = QBrush(QColor(20, 20, 30))
+        self._display_pen = QPen(QColor(60, 60, 70), 1)
+        self._display_font = QFont("Consolas", 14, QFont.Weight.Bold)
+        self._unit_font = QFont("Arial", 8)
+        self._unit_color = QColor(150, 150, 160)
+        self._title_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._title_color = QColor(200, 200, 210)
+
+        # Cap gradient relative to the cap's bounding box, so it follows resizes
+        cap_gradient = QRadialGradient(0.5, 0.5 - 5 / 36, 20 / 36)
+        cap_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+        cap_gradient.setColorAt(0, QColor(120, 120, 130))
+        cap_gradient.setColorAt(0.5, QColor(80, 80, 90))
+        cap_gradient.setColorAt(1, QColor(50, 50, 60))
+        self._cap_brush = QBrush(cap_gradient)
 
-        # Animation timers
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Needle and readout colors below warning, from warning, and from critical
+        self._needle_level_colors = (QColor(255, 100, 100), QColor(255, 180, 50), QColor(255, 80, 80))
+        self._display_level_colors = (QColor(100, 255, 150), QColor(255, 200, 50), QColor(255, 80, 80))
+
+        self.setMinimumSize(200, 220)
 
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_value)
-        self.value_timer.start(16)
+        # Animation driven by the shared frame clock
+        self._easing = False
+        self._pending_dt = 0.0
+        FrameClock.instance().attach(self, self._animate)
 
     def setValue(self, value: float):
         self._target_value = max(self.min_value, min(self.max_value, value))
+        self._easing = True
 
     def value(self) -> float:
         return self._current_value
 
-    def _animate(self):
-        self._glow_phase += 0.05
-        self._needle_oscillation += 0.1
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            # value() feeds the charts, so keep easing while off screen
+            if self._easing:
+                self._animate_value(dt * 60)
+            return
+
+        # Once the value has settled only the glow moves, which needs ~15 fps
+        self._pending_dt += dt
+        if not self._easing and self._pending_dt < IDLE_FRAME_TIME:
+            return
+        dt, self._pending_dt = self._pending_dt, 0.0
+
+        step = dt * 60  # frames elapsed at 60 fps
+        self._glow_phase += 0.05 * step
+        self._needle_oscillation += 0.1 * step
 
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
         if self._needle_oscillation > 2 * math.pi:
             self._needle_oscillation -= 2 * math.pi
 
-        self.update()
+        if self._easing:
+            self._animate_value(step)
 
-    def _animate_value(self):
+        # Only the needle and the digital readout change between frames
+        if self._needle_rect.isNull():
+            self.update()
+        else:
+            self.update(self._dirty_region())
+
+    def _dirty_region(self):
+        """Region swept by the needle since the last paint, plus the readout while easing"""
+        cx = self.width() / 2
+        cy = self.height() / 2
+        r = min(self.width(), self.height()) / 2 - 25
+
+        angle_rad = self._needle_angle_rad()
+        needle_rect = self._needle_bounds(cx, cy, r, math.cos(angle_rad), math.sin(angle_rad))
+        region = QRegion(needle_rect.united(self._needle_rect).toAlignedRect())
+        if self._easing:
+            region += self._display_rect(cx, cy).toAlignedRect()
+        return region
+
+    def _animate_value(self, step: float):
         diff = self._target_value - self._display_value
         if abs(diff) > 0.01:
-            self._display_value += diff * 0.1
+            self._display_value += diff * (1 - 0.9 ** step)
             self._current_value = self._display_value
+        else:
+            self._easing = False
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -705,26 +1150,54 @@ class AnimatedSpeedometer(QWidget):
         center_y = height / 2
         radius = min(width, height) / 2 - 25
 
-        # Draw background
-        self._draw_background(painter, center_x, center_y, radius)
+        # Skip layers outside the region being repainted: everything but the
+        # title sits inside the outer ring
+        region = event.region()
+        face_rect = QRectF(center_x - radius - 17, center_y - radius - 17,
+                           (radius + 17) * 2, (radius + 17) * 2).toAlignedRect()
+        title_rect = QRectF(center_x - 60, center_y + radius + 5, 120, 20).toAlignedRect()
 
-        # Draw colored zones
-        self._draw_zones(painter, center_x, center_y, radius)
+        if region.intersects(face_rect):
+            # Draw cached background, colored zones and scale
+            if self._static_cache is None:
+                self._static_cache = self._build_static_cache(center_x, center_y, radius)
+            painter.drawPixmap(0, 0, self._static_cache)
 
-        # Draw scale
-        self._draw_scale(painter, center_x, center_y, radius)
+            # Draw needle
+            self._draw_needle(painter, center_x, center_y, radius)
 
-        # Draw needle
-        self._draw_needle(painter, center_x, center_y, radius)
+            # Draw center cap
+            self._draw_center_cap(painter, center_x, center_y)
 
-        # Draw center cap
-        self._draw_center_cap(painter, center_x, center_y)
-
-        # Draw digital display
-        self._draw_digital_display(painter, center_x, center_y, radius)
+            # Draw digital display
+            if region.intersects(self._display_rect(center_x, center_y).toAlignedRect()):
+                self._draw_digital_display(painter, center_x, center_y, radius)
 
         # Draw title
-        self._draw_title(painter, center_x, center_y, radius)
+        if region.intersects(title_rect):
+            self._draw_title(painter, center_x, center_y, radius)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache = None
+        self._needle_poly = None
+        self._shadow_poly = None
+
+    def _build_static_cache(self, cx, cy, r):
+        """Render the size-dependent background, zones and scale into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(painter, cx, cy, r)
+        self._draw_zones(painter, cx, cy, r)
+        self._draw_scale(painter, cx, cy, r)
+        painter.end()
+
+        return cache
 
     def _draw_background(self, painter, cx, cy, r):
         """Draw gauge background"""
@@ -790,140 +1263,128 @@ class AnimatedSpeedometer(QWidget):
 
         # Minor ticks
         painter.setPen(QPen(QColor(100, 100, 110), 1))
-        for i in range(num_minor + 1):
-            angle_deg = start_angle - (total_angle * i / num_minor)
-            angle_rad = math.radians(angle_deg)
-
-            inner_r = r - 20
-            outer_r = r - 12
-
-            x1 = cx + inner_r * math.cos(angle_rad)
-            y1 = cy - inner_r * math.sin(angle_rad)
-            x2 = cx + outer_r * math.cos(angle_rad)
-            y2 = cy - outer_r * math.sin(angle_rad)
-
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLines(_tick_lines(cx, cy, r - 20, r - 12, start_angle, start_angle - total_angle, num_minor))
 
-        # Major ticks and numbers
-        painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        # Major ticks, grouped by zone so each color is one drawLines call
+        major_lines = _tick_lines(cx, cy, r - 25, r - 10, start_angle, start_angle - total_angle, num_major)
+        zone_lines = ([], [], [])
         for i in range(num_major + 1):
-            angle_deg = start_angle - (total_angle * i / num_major)
-            angle_rad = math.radians(angle_deg)
-
-            # Tick
-            inner_r = r - 25
-            outer_r = r - 10
-
-            # Color based on zone
             value_at_tick = self.min_value + (total_range * i / num_major)
             if value_at_tick >= self.critical_threshold:
-                tick_color = QColor(255, 100, 100)
+                zone_lines[2].append(major_lines[i])
             elif value_at_tick >= self.warning_threshold:
-                tick_color = QColor(255, 200, 100)
+                zone_lines[1].append(major_lines[i])
             else:
-                tick_color = QColor(100, 200, 150)
+                zone_lines[0].append(major_lines[i])
 
-            painter.setPen(QPen(tick_color, 2))
+        zone_colors = (QColor(100, 200, 150), QColor(255, 200, 100), QColor(255, 100, 100))
+        for tick_color, lines in zip(zone_colors, zone_lines):
+            if lines:
+                painter.setPen(QPen(tick_color, 2))
+                painter.drawLines(lines)
 
-            x1 = cx + inner_r * math.cos(angle_rad)
-            y1 = cy - inner_r * math.sin(angle_rad)
-            x2 = cx + outer_r * math.cos(angle_rad)
-            y2 = cy - outer_r * math.sin(angle_rad)
-
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        # Numbers
+        painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        painter.setPen(QPen(QColor(200, 200, 210)))
+        for i in range(num_major + 1):
+            angle_rad = math.radians(start_angle - (total_angle * i / num_major))
+            value_at_tick = self.min_value + (total_range * i / num_major)
 
-            # Number
             text_r = r - 38
             text_x = cx + text_r * math.cos(angle_rad)
             text_y = cy - text_r * math.sin(angle_rad)
 
-            painter.setPen(QPen(QColor(200, 200, 210)))
             text = str(int(value_at_tick))
 
             text_rect = QRectF(text_x - 15, text_y - 8, 30, 16)
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, text)
 
-    def _draw_needle(self, painter, cx, cy, r):
-        """Draw animated needle"""
-        # Calculate needle angle
+    def _needle_angle_rad(self):
+        """Current needle angle in radians, counter-clockwise from 3 o'clock"""
         percentage = (self._display_value - self.min_value) / (self.max_value - self.min_value)
         target_angle = 225 - (270 * percentage)
 
         # Add slight oscillation for realism
         oscillation = math.sin(self._needle_oscillation) * 0.5 * (1 - percentage * 0.5)
-        needle_angle = target_angle + oscillation
+        return math.radians(target_angle + oscillation)
+
+    def _value_level(self):
+        """0 below the warning threshold, 1 from warning, 2 from critical"""
+        return (self._display_value >= self.warning_threshold) + (self._display_value >= self.critical_threshold)
+
+    @staticmethod
+    def _needle_bounds(cx, cy, r, c, s):
+        """Bounding rect of the needle and its offset shadow, given the angle's cos and sin"""
+        xs = (cx + (r - 25) * c, cx - 15 * c, cx - 8 * s, cx + 8 * s)
+        ys = (cy - (r - 25) * s, cy + 15 * s, cy - 8 * c, cy + 8 * c)
+        left = min(xs)
+        top = min(ys)
+        # Pen and antialiasing margin, plus the shadow's 3 px offset
+        return QRectF(left, top, max(xs) - left, max(ys) - top).adjusted(-2, -2, 5, 5)
+
+    @staticmethod
+    def _display_rect(cx, cy):
+        """Digital display and unit label"""
+        return QRectF(cx - 36, cy + 24, 72, 42)
+
+    @staticmethod
+    def _needle_polygons(r):
+        """Needle and shadow outlines around the pivot, pointing along +x"""
+        needle = QPolygonF([QPointF(r - 25, 0), QPointF(0, -6), QPointF(-15, 0), QPointF(0, 6)])
+        shadow = QPolygonF([QPointF(r - 25, 0), QPointF(0, -8), QPointF(-15, 0), QPointF(0, 8)])
+        return needle, shadow
 
-        angle_rad = math.radians(needle_angle)
+    def _draw_needle(self, painter, cx, cy, r):
+        """Draw animated needle"""
+        angle_rad = self._needle_angle_rad()
+        angle_deg = math.degrees(angle_rad)
+        self._needle_rect = self._needle_bounds(cx, cy, r, math.cos(angle_rad), math.sin(angle_rad))
+
+        # The outlines only depend on the radius; the painter rotates them
+        if self._needle_poly is None:
+            self._needle_poly, self._shadow_poly = self._needle_polygons(r)
 
         # Needle shadow
         shadow_offset = 3
-        painter.setBrush(QBrush(QColor(0, 0, 0, 80)))
+        painter.save()
+        painter.translate(cx + shadow_offset, cy + shadow_offset)
+        painter.rotate(-angle_deg)
+        painter.setBrush(self._shadow_brush)
         painter.setPen(Qt.PenStyle.NoPen)
-
-        shadow_points = [
-            QPointF(cx + shadow_offset + (r - 25) * math.cos(angle_rad),
-                   cy + shadow_offset - (r - 25) * math.sin(angle_rad)),
-            QPointF(cx + shadow_offset + 8 * math.cos(angle_rad + math.pi/2),
-                   cy + shadow_offset - 8 * math.sin(angle_rad + math.pi/2)),
-            QPointF(cx + shadow_offset - 15 * math.cos(angle_rad),
-                   cy + shadow_offset + 15 * math.sin(angle_rad)),
-            QPointF(cx + shadow_offset + 8 * math.cos(angle_rad - math.pi/2),
-                   cy + shadow_offset - 8 * math.sin(angle_rad - math.pi/2)),
-        ]
-        painter.drawPolygon(shadow_points)
+        painter.drawPolygon(self._shadow_poly)
+        painter.restore()
 
         # Needle body
-        needle_gradient = QLinearGradient(
-            cx + (r - 25) * math.cos(angle_rad),
-            cy - (r - 25) * math.sin(angle_rad),
-            cx - 15 * math.cos(angle_rad),
-            cy + 15 * math.sin(angle_rad)
-        )
+        needle_gradient = QLinearGradient(r - 25, 0, -15, 0)
 
         # Color based on current value
-        if self._display_value >= self.critical_threshold:
-            needle_color = QColor(255, 80, 80)
-        elif self._display_value >= self.warning_threshold:
-            needle_color = QColor(255, 180, 50)
-        else:
-            needle_color = QColor(255, 100, 100)
+        needle_color = self._needle_color
+        needle_color.setRgb(self._needle_level_colors[self._value_level()].rgb())
 
-        glow_intensity = 0.7 + 0.3 * math.sin(self._glow_phase)
+        glow_intensity = 0.7 + 0.3 * PHASE_SIN[_phase_step(self._glow_phase)]
         needle_color.setAlpha(int(255 * glow_intensity))
 
         needle_gradient.setColorAt(0, needle_color)
-        needle_gradient.setColorAt(0.5, QColor(200, 200, 200))
-        needle_gradient.setColorAt(1, QColor(100, 100, 100))
+        needle_gradient.setColorAt(0.5, self._needle_mid_color)
+        needle_gradient.setColorAt(1, self._needle_tail_color)
 
+        painter.save()
+        painter.translate(cx, cy)
+        painter.rotate(-angle_deg)
         painter.setBrush(QBrush(needle_gradient))
-        painter.setPen(QPen(QColor(50, 50, 50), 1))
-
-        needle_points = [
-            QPointF(cx + (r - 25) * math.cos(angle_rad),
-                   cy - (r - 25) * math.sin(angle_rad)),
-            QPointF(cx + 6 * math.cos(angle_rad + math.pi/2),
-                   cy - 6 * math.sin(angle_rad + math.pi/2)),
-            QPointF(cx - 15 * math.cos(angle_rad),
-                   cy + 15 * math.sin(angle_rad)),
-            QPointF(cx + 6 * math.cos(angle_rad - math.pi/2),
-                   cy - 6 * math.sin(angle_rad - math.pi/2)),
-        ]
-        painter.drawPolygon(needle_points)
+        painter.setPen(self._needle_pen)
+        painter.drawPolygon(self._needle_poly)
+        painter.restore()
 
     def _draw_center_cap(self, painter, cx, cy):
         """Draw center cap"""
         # Outer ring
-        cap_gradient = QRadialGradient(cx, cy - 5, 20)
-        cap_gradient.setColorAt(0, QColor(120, 120, 130))
-        cap_gradient.setColorAt(0.5, QColor(80, 80, 90))
-        cap_gradient.setColorAt(1, QColor(50, 50, 60))
-
-        painter.setBrush(QBrush(cap_gradient))
-        painter.setPen(QPen(QColor(60, 60, 70), 2))
+        painter.setBrush(self._cap_brush)
+        painter.setPen(self._cap_pen)
         painter.drawEllipse(QPointF(cx, cy), 18, 18)
 
         # Inner highlight
-        painter.setBrush(QBrush(QColor(100, 100, 110)))
+        painter.setBrush(self._cap_highlight)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(QPointF(cx, cy - 2), 8, 8)
 
@@ -932,34 +1393,27 @@ class AnimatedSpeedometer(QWidget):
         display_rect = QRectF(cx - 35, cy + 25, 70, 25)
 
         # Display background
-        painter.setBrush(QBrush(QColor(20, 20, 30)))
-        painter.setPen(QPen(QColor(60, 60, 70), 1))
+        painter.setBrush(self._display_brush)
+        painter.setPen(self._display_pen)
         painter.drawRoundedRect(display_rect, 5, 5)
 
         # Value text
-        painter.setFont(QFont("Consolas", 14, QFont.Weight.Bold))
+        painter.setFont(self._display_font)
 
         # Color based on value
-        if self._display_value >= self.critical_threshold:
-            text_color = QColor(255, 80, 80)
-        elif self._display_value >= self.warning_threshold:
-            text_color = QColor(255, 200, 50)
-        else:
-            text_color = QColor(100, 255, 150)
-
-        painter.setPen(QPen(text_color))
+        painter.setPen(self._display_level_colors[self._value_level()])
         painter.drawText(display_rect, Qt.AlignmentFlag.AlignCenter, f"{self._display_value:.1f}")
 
         # Unit
-        painter.setFont(QFont("Arial", 8))
-        painter.setPen(QPen(QColor(150, 150, 160)))
+        painter.setFont(self._unit_font)
+        painter.setPen(self._unit_color)
         unit_rect = QRectF(cx - 25, cy + 50, 50, 15)
         painter.drawText(unit_rect, Qt.AlignmentFlag.AlignCenter, self.unit)
 
     def _draw_title(self, painter, cx, cy, r):
         """Draw gauge title"""
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.setPen(QPen(QColor(200, 200, 210)))
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_color)
 
         title_rect = QRectF(cx - 60, cy + r + 5, 120, 20)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
@@ -974,6 +1428,9 @@ class LiveLineChart(QWidget):
     Live animated line chart with smooth scrolling
     """
 
+    # Only a glow pulse animates between data updates, which reads fine at 30 fps
+    FPS = 30
+
     def __init__(self,
                  title: str = "Live Data",
                  y_label: str = "Value",
@@ -990,7 +1447,7 @@ class LiveLineChart(QWidget):
         self.fill = fill
 
         # Data storage
-        self.data = deque(maxlen=max_points)
+        self.data = RingBuffer(max_points)
         self.timestamps = deque(maxlen=max_points)
 
         # Animation
@@ -1001,23 +1458,65 @@ class LiveLineChart(QWidget):
         self.y_min = 0
         self.y_max = 100
         self.auto_range = True
+        self._data_min = 0.0
+        self._data_max = 0.0
+
+        # Between data updates only the pulsing line and last point repaint
+        self._dirty = True
+        self._pulse_region = QRegion()
+
+        # Line path and polygon, rebuilt when the data, range or size changes
+        self._cached_path = None
+        self._cached_points = None
+        self._cached_sig = None
+
+        # Glow strokes around the cached path, redrawn with it
+        self._glow_cache = None
+        self._glow_rgba = None
+
+        # Background, grid, axes and title, redrawn on resize or range change
+        self._static_cache = None
+        self._static_range = None
+
+        # Paint objects reused every frame
+        self._bg_brush = _chart_background_brush(QColor(25, 30, 40), QColor(15, 20, 30))
+        self._frame_pen = QPen(QColor(60, 70, 80), 1)
+        self._grid_pen = QPen(QColor(50, 60, 70), 1, Qt.PenStyle.DotLine)
+        self._point_pen = QPen(QColor(255, 255, 255), 1)
+        self._last_point_pen = QPen(QColor(255, 255, 255), 2)
+        self._label_font = QFont("Arial", 10, QFont.Weight.Bold)
+        self._label_bg = QColor(30, 35, 45, 200)
+        self._axis_pen = QPen(QColor(150, 160, 170), 1)
+        self._axis_font = QFont("Arial", 9)
+        self._title_font = QFont("Arial", 14, QFont.Weight.Bold)
+        self._title_color = QColor(200, 210, 220)
 
         self.setMinimumSize(400, 200)
 
-        # Animation timer
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Animation driven by the shared frame clock, throttled to FPS
+        self._pending_dt = 0.0
+        FrameClock.instance().attach(self, self._animate)
 
     def addDataPoint(self, value: float, timestamp: datetime = None):
         """Add a new data point"""
-        self.data.append(value)
+        evicted = self.data.view()[0] if len(self.data) == self.data.capacity else None
+        self.data.push(value)
         self.timestamps.append(timestamp or datetime.now())
+        self._dirty = True
+        self._cached_sig = None
+
+        # Track the extremes incrementally; rescan only when one drops out
+        if len(self.data) == 1 or evicted in (self._data_min, self._data_max):
+            data = self.data.view()
+            self._data_min = float(data.min())
+            self._data_max = float(data.max())
+        else:
+            self._data_min = min(self._data_min, value)
+            self._data_max = max(self._data_max, value)
 
-        if self.auto_range and len(self.data) > 0:
-            data_list = list(self.data)
-            self.y_min = min(data_list) * 0.9
-            self.y_max = max(data_list) * 1.1
+        if self.auto_range:
+            self.y_min = self._data_min * 0.9
+            self.y_max = self._data_max * 1.1
             if self.y_min == self.y_max:
                 self.y_max = self.y_min + 1
 
@@ -1026,15 +1525,31 @@ class LiveLineChart(QWidget):
         self.y_min = y_min
         self.y_max = y_max
         self.auto_range = False
+        self._dirty = True
+        self._cached_sig = None
 
-    def _animate(self):
-        self._scroll_offset += 0.5
-        self._glow_phase += 0.05
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            return
+
+        # Skip clock ticks until a frame at FPS is due; 0.9 allows for timer jitter
+        self._pending_dt += dt
+        if self._pending_dt < 0.9 / self.FPS:
+            return
+        step = self._pending_dt * 60  # frames elapsed at 60 fps
+        self._pending_dt = 0.0
+
+        self._scroll_offset += 0.5 * step
+        self._glow_phase += 0.05 * step
 
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
 
-        self.update()
+        if self._dirty:
+            self._dirty = False
+            self.update()
+        else:
+            self.update(self._pulse_region)
 
     def paintEvent(self, event):
         if len(self.data) < 2:
@@ -1055,82 +1570,91 @@ class LiveLineChart(QWidget):
         chart_width = width - margin_left - margin_right
         chart_height = height - margin_top - margin_bottom
 
-        # Draw background
-        self._draw_background(painter, margin_left, margin_top, chart_width, chart_height)
-
-        # Draw grid
-        self._draw_grid(painter, margin_left, margin_top, chart_width, chart_height)
+        # Draw background, grid, axes and title from the cache
+        if self._static_cache is None or self._static_range != (self.y_min, self.y_max):
+            self._static_cache = self._build_static_cache(margin_left, margin_top,
+                                                          chart_width, chart_height)
+            self._static_range = (self.y_min, self.y_max)
+        painter.drawPixmap(0, 0, self._static_cache)
 
         # Draw data
         self._draw_data(painter, margin_left, margin_top, chart_width, chart_height)
 
-        # Draw axes
-        self._draw_axes(painter, margin_left, margin_top, chart_width, chart_height)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache = None
 
-        # Draw title
-        self._draw_title(painter, width)
+    def _build_static_cache(self, x, y, w, h):
+        """Render the background, grid, axis labels and title into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(painter, x, y, w, h)
+        self._draw_grid(painter, x, y, w, h)
+        self._draw_axes(painter, x, y, w, h)
+        self._draw_title(painter, self.width())
+        painter.end()
+
+        return cache
 
     def _draw_background(self, painter, x, y, w, h):
         """Draw chart background"""
-        bg_gradient = QLinearGradient(x, y, x, y + h)
-        bg_gradient.setColorAt(0, QColor(25, 30, 40))
-        bg_gradient.setColorAt(1, QColor(15, 20, 30))
-
-        painter.setBrush(QBrush(bg_gradient))
-        painter.setPen(QPen(QColor(60, 70, 80), 1))
+        painter.setBrush(self._bg_brush)
+        painter.setPen(self._frame_pen)
         painter.drawRoundedRect(QRectF(x, y, w, h), 5, 5)
 
     def _draw_grid(self, painter, x, y, w, h):
         """Draw grid lines"""
-        painter.setPen(QPen(QColor(50, 60, 70), 1, Qt.PenStyle.DotLine))
+        painter.setPen(self._grid_pen)
 
-        # Horizontal grid lines
+        # Horizontal and vertical grid lines in one call
         num_h_lines = 5
-        for i in range(num_h_lines + 1):
-            line_y = y + (h * i / num_h_lines)
-            painter.drawLine(QPointF(x, line_y), QPointF(x + w, line_y))
-
-        # Vertical grid lines
         num_v_lines = 10
-        for i in range(num_v_lines + 1):
-            line_x = x + (w * i / num_v_lines)
-            painter.drawLine(QPointF(line_x, y), QPointF(line_x, y + h))
+        lines = [QLineF(x, y + (h * i / num_h_lines), x + w, y + (h * i / num_h_lines))
+                 for i in range(num_h_lines + 1)]
+        lines += [QLineF(x + (w * i / num_v_lines), y, x + (w * i / num_v_lines), y + h)
+                  for i in range(num_v_lines + 1)]
+        painter.drawLines(lines)
 
     def _draw_data(self, painter, x, y, w, h):
         """Draw the data line with glow effect"""
         if len(self.data) < 2:
             return
 
-        data_list = list(self.data)
-        num_points = len(data_list)
+        # Create path, unless only the glow phase changed since the last paint
+        sig = (x, y, w, h, self.y_min, self.y_max)
+        if sig != self._cached_sig:
+            px, py = _line_points(self.data.view(), float(self.y_min), float(self.y_max),
+                                  float(x), float(y), float(w), float(h))
+            points = _polygon_from_arrays(px, py)
 
-        # Create path
-        path = QPainterPath()
-        points = []
+            path = QPainterPath()
+            path.addPolygon(points)
 
-        for i, value in enumerate(data_list):
-            px = x + (w * i / (num_points - 1))
-            py = y + h - (h * (value - self.y_min) / (self.y_max - self.y_min))
-            py = max(y, min(y + h, py))
-            points.append(QPointF(px, py))
+            self._cached_path = path
+            self._cached_points = points
+            self._cached_sig = sig
+            self._glow_cache = None
 
-        path.moveTo(points[0])
-        for point in points[1:]:
-            path.lineTo(point)
+        path = self._cached_path
+        points = self._cached_points
+        num_points = len(points)
 
-        # Draw glow layers
+        # Draw glow layers, composited once per path and faded as a whole
         glow_intensity = 0.6 + 0.4 * math.sin(self._glow_phase)
 
-        for i in range(4, 0, -1):
-            glow_color = QColor(self.line_color)
-            glow_color.setAlpha(int(30 * glow_intensity * (5 - i) / 4))
+        if self._glow_cache is None or self._glow_rgba != self.line_color.rgba():
+            self._glow_cache = self._build_glow_cache(path)
+            self._glow_rgba = self.line_color.rgba()
 
-            pen = QPen(glow_color, 2 + i * 2)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawPath(path)
+        painter.setOpacity(glow_intensity)
+        painter.drawPixmap(0, 0, self._glow_cache)
+        painter.setOpacity(1.0)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
 
         # Draw main line
         pen = QPen(self.line_color, 2)
@@ -1158,14 +1682,15 @@ class LiveLineChart(QWidget):
             painter.drawPath(fill_path)
 
         # Draw data points
-        painter.setBrush(QBrush(self.line_color))
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
+        painter.setBrush(self.line_color)
+        painter.setPen(self._point_pen)
 
         # Only draw every nth point to avoid clutter
         step = max(1, num_points // 20)
-        for i, point in enumerate(points):
-            if i % step == 0 or i == len(points) - 1:
-                painter.drawEllipse(point, 4, 4)
+        for i in range(0, num_points, step):
+            painter.drawEllipse(points[i], 4, 4)
+        if (num_points - 1) % step:
+            painter.drawEllipse(points[-1], 4, 4)
 
         # Highlight last point
         if points:
@@ -1176,35 +1701,62 @@ class LiveLineChart(QWidget):
 
             pulse_color = QColor(self.line_color)
             pulse_color.setAlpha(100)
-            painter.setBrush(QBrush(pulse_color))
+            painter.setBrush(pulse_color)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(last_point, pulse_size + 4, pulse_size + 4)
 
-            painter.setBrush(QBrush(self.line_color))
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
+            painter.setBrush(self.line_color)
+            painter.setPen(self._last_point_pen)
             painter.drawEllipse(last_point, pulse_size, pulse_size)
 
             # Value label
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+            painter.setFont(self._label_font)
             painter.setPen(QPen(self.line_color))
 
-            value_text = f"{data_list[-1]:.1f}"
+            value_text = f"{self.data.view()[-1]:.1f}"
             label_rect = QRectF(last_point.x() + 10, last_point.y() - 20, 60, 20)
 
             # Background for label
-            painter.setBrush(QBrush(QColor(30, 35, 45, 200)))
+            painter.setBrush(self._label_bg)
             painter.setPen(QPen(self.line_color, 1))
             painter.drawRoundedRect(label_rect, 3, 3)
 
             painter.setPen(QPen(self.line_color))
             painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, value_text)
 
+            # Area the glow, fill and pulse cover, repainted between data updates
+            self._pulse_region = QRegion(QRectF(x, y, w, h).adjusted(-5, -5, 5, 5).toAlignedRect())
+            self._pulse_region += QRectF(last_point.x() - 14, last_point.y() - 21, 85, 35).toAlignedRect()
+
+    def _build_glow_cache(self, path):
+        """Render the 4 widening glow strokes around the line at full intensity"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for i in range(4, 0, -1):
+            glow_color = QColor(self.line_color)
+            glow_color.setAlpha(int(30 * (5 - i) / 4))
+
+            pen = QPen(glow_color, 2 + i * 2)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+            painter.setPen(pen)
+            painter.drawPath(path)
+        painter.end()
+
+        return cache
+
     def _draw_axes(self, painter, x, y, w, h):
         """Draw axes and labels"""
-        painter.setPen(QPen(QColor(150, 160, 170), 1))
+        painter.setPen(self._axis_pen)
 
         # Y-axis labels
-        painter.setFont(QFont("Arial", 9))
+        painter.setFont(self._axis_font)
         num_labels = 5
         for i in range(num_labels + 1):
             label_y = y + (h * i / num_labels)
@@ -1223,8 +1775,8 @@ class LiveLineChart(QWidget):
 
     def _draw_title(self, painter, width):
         """Draw chart title"""
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        painter.setPen(QPen(QColor(200, 210, 220)))
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_color)
 
         title_rect = QRectF(0, 5, width, 30)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
@@ -1235,6 +1787,9 @@ class LiveCandlestickChart(QWidget):
     Live animated candlestick chart for financial data
     """
 
+    # Only a glow pulse animates between data updates, which reads fine at 30 fps
+    FPS = 30
+
     def __init__(self,
                  title: str = "Price Chart",
                  max_candles: int = 50,
@@ -1244,9 +1799,22 @@ class LiveCandlestickChart(QWidget):
         self.title = title
         self.max_candles = max_candles
 
-        # Data storage (open, high, low, close, timestamp)
+        # Data storage, as Candle records
         self.candles = deque(maxlen=max_candles)
 
+        # The same candles' open, high, low, close as rows, for drawing
+        self._ohlc = RingBuffer(max_candles, width=4)
+
+        # Lowest low and highest high of those candles, tracked incrementally
+        self._low_min = math.inf
+        self._high_max = -math.inf
+
+        # Rows to draw, including the current candle, and their price range;
+        # rebuilt after new data rather than every frame
+        self._frame_ohlc = None
+        self._price_min = 0.0
+        self._price_max = 0.0
+
         # Current forming candle
         self.current_candle = None
 
@@ -1257,39 +1825,74 @@ class LiveCandlestickChart(QWidget):
         self.bull_color = QColor(50, 200, 100)
         self.bear_color = QColor(255, 80, 80)
 
+        # Between data updates only the current candle's glow repaints
+        self._dirty = True
+        self._pulse_region = QRegion()
+
+        # Background, grid, price labels and title, redrawn on resize or range change
+        self._static_cache = None
+        self._static_range = None
+
+        # Paint objects reused every frame
+        self._bg_brush = _chart_background_brush(QColor(20, 25, 35), QColor(10, 15, 25))
+        self._frame_pen = QPen(QColor(50, 60, 70), 1)
+        self._grid_pen = QPen(QColor(40, 50, 60), 1, Qt.PenStyle.DotLine)
+        self._label_color = QColor(150, 160, 170)
+        self._label_font = QFont("Consolas", 9)
+        self._title_font = QFont("Arial", 14, QFont.Weight.Bold)
+        self._title_color = QColor(200, 210, 220)
+
         self.setMinimumSize(500, 300)
 
-        # Animation timer
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        # Animation driven by the shared frame clock, throttled to FPS
+        self._pending_dt = 0.0
+        FrameClock.instance().attach(self, self._animate)
 
     def addCandle(self, open_price: float, high: float, low: float, close: float,
                   timestamp: datetime = None):
         """Add a completed candle"""
-        self.candles.append({
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'timestamp': timestamp or datetime.now()
-        })
+        evicted = self.candles[0] if len(self.candles) == self.candles.maxlen else None
+        self.candles.append(Candle(open_price, high, low, close, timestamp or datetime.now()))
+        self._ohlc.push((open_price, high, low, close))
+
+        # Rescan the extremes only when the dropped candle held one
+        if evicted is not None and (evicted.low == self._low_min or evicted.high == self._high_max):
+            ohlc = self._ohlc.view()
+            self._low_min = float(ohlc[:, 2].min())
+            self._high_max = float(ohlc[:, 1].max())
+        else:
+            self._low_min = min(self._low_min, low)
+            self._high_max = max(self._high_max, high)
+
+        self._frame_ohlc = None
+        self._dirty = True
 
     def updateCurrentCandle(self, open_price: float, high: float, low: float, close: float):
         """Update the current forming candle"""
-        self.current_candle = {
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'timestamp': datetime.now()
-        }
-
-    def _animate(self):
-        self._glow_phase += 0.05
+        self.current_candle = Candle(open_price, high, low, close, datetime.now())
+        self._frame_ohlc = None
+        self._dirty = True
+
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            return
+
+        # Skip clock ticks until a frame at FPS is due; 0.9 allows for timer jitter
+        self._pending_dt += dt
+        if self._pending_dt < 0.9 / self.FPS:
+            return
+        step = self._pending_dt * 60  # frames elapsed at 60 fps
+        self._pending_dt = 0.0
+
+        self._glow_phase += 0.05 * step
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
-        self.update()
+
+        if self._dirty:
+            self._dirty = False
+            self.update()
+        else:
+            self.update(self._pulse_region)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -1307,88 +1910,104 @@ class LiveCandlestickChart(QWidget):
         chart_width = width - margin_left - margin_right
         chart_height = height - margin_top - margin_bottom
 
-        # Draw background
-        self._draw_background(painter, margin_left, margin_top, chart_width, chart_height)
-
-        # Get all candles including current
-        all_candles = list(self.candles)
-        if self.current_candle:
-            all_candles.append(self.current_candle)
-
-        if not all_candles:
+        # Get all candles including current, and the price range
+        if self._frame_ohlc is None:
+            ohlc = self._ohlc.view()
+            low_min = self._low_min
+            high_max = self._high_max
+            if self.current_candle:
+                c = self.current_candle
+                ohlc = np.concatenate((ohlc, [(c.open, c.high, c.low, c.close)]))
+                low_min = min(low_min, c.low)
+                high_max = max(high_max, c.high)
+            self._frame_ohlc = ohlc
+            self._price_min = low_min * 0.999
+            self._price_max = high_max * 1.001
+
+        ohlc = self._frame_ohlc
+        if not len(ohlc):
+            self._draw_background(painter, margin_left, margin_top, chart_width, chart_height)
             return
 
-        # Calculate price range
-        all_prices = []
-        for c in all_candles:
-            all_prices.extend([c['high'], c['low']])
-
-        price_min = min(all_prices) * 0.999
-        price_max = max(all_prices) * 1.001
+        price_min = self._price_min
+        price_max = self._price_max
 
-        # Draw grid
-        self._draw_grid(painter, margin_left, margin_top, chart_width, chart_height,
-                       price_min, price_max)
+        # Draw background, grid and title from the cache
+        if self._static_cache is None or self._static_range != (price_min, price_max):
+            self._static_cache = self._build_static_cache(margin_left, margin_top,
+                                                          chart_width, chart_height,
+                                                          price_min, price_max)
+            self._static_range = (price_min, price_max)
+        painter.drawPixmap(0, 0, self._static_cache)
 
         # Draw candles
         self._draw_candles(painter, margin_left, margin_top, chart_width, chart_height,
-                          all_candles, price_min, price_max)
+                          ohlc, price_min, price_max)
 
-        # Draw title
-        self._draw_title(painter, width)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache = None
+
+    def _build_static_cache(self, x, y, w, h, price_min, price_max):
+        """Render the background, price grid and title into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(painter, x, y, w, h)
+        self._draw_grid(painter, x, y, w, h, price_min, price_max)
+        self._draw_title(painter, self.width())
+        painter.end()
+
+        return cache
 
     def _draw_background(self, painter, x, y, w, h):
         """Draw chart background"""
-        bg_gradient = QLinearGradient(x, y, x, y + h)
-        bg_gradient.setColorAt(0, QColor(20, 25, 35))
-        bg_gradient.setColorAt(1, QColor(10, 15, 25))
-
-        painter.setBrush(QBrush(bg_gradient))
-        painter.setPen(QPen(QColor(50, 60, 70), 1))
+        painter.setBrush(self._bg_brush)
+        painter.setPen(self._frame_pen)
         painter.drawRoundedRect(QRectF(x, y, w, h), 5, 5)
 
     def _draw_grid(self, painter, x, y, w, h, price_min, price_max):
         """Draw price grid"""
-        painter.setPen(QPen(QColor(40, 50, 60), 1, Qt.PenStyle.DotLine))
-
-        # Horizontal lines and price labels
         num_lines = 6
-        painter.setFont(QFont("Consolas", 9))
+        line_ys = [y + (h * i / num_lines) for i in range(num_lines + 1)]
 
-        for i in range(num_lines + 1):
-            line_y = y + (h * i / num_lines)
-            painter.drawLine(QPointF(x, line_y), QPointF(x + w, line_y))
+        # Horizontal lines
+        painter.setPen(self._grid_pen)
+        painter.drawLines([QLineF(x, line_y, x + w, line_y) for line_y in line_ys])
 
+        # Price labels
+        painter.setPen(self._label_color)
+        painter.setFont(self._label_font)
+        for i, line_y in enumerate(line_ys):
             price = price_max - (price_max - price_min) * i / num_lines
-
-            painter.setPen(QPen(QColor(150, 160, 170)))
             label_rect = QRectF(5, line_y - 8, x - 10, 16)
             painter.drawText(label_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
                            f"{price:.2f}")
-            painter.setPen(QPen(QColor(40, 50, 60), 1, Qt.PenStyle.DotLine))
 
-    def _draw_candles(self, painter, x, y, w, h, candles, price_min, price_max):
-        """Draw candlesticks"""
-        if not candles:
+    def _draw_candles(self, painter, x, y, w, h, ohlc, price_min, price_max):
+        """Draw candlesticks from (open, high, low, close) rows"""
+        if not len(ohlc):
             return
 
-        num_candles = len(candles)
+        num_candles = len(ohlc)
         candle_width = max(3, (w / num_candles) * 0.7)
         spacing = w / num_candles
 
         price_range = price_max - price_min
+        self._pulse_region = QRegion()
 
-        for i, candle in enumerate(candles):
-            cx = x + spacing * i + spacing / 2
-
-            # Calculate positions
-            open_y = y + h * (1 - (candle['open'] - price_min) / price_range)
-            close_y = y + h * (1 - (candle['close'] - price_min) / price_range)
-            high_y = y + h * (1 - (candle['high'] - price_min) / price_range)
-            low_y = y + h * (1 - (candle['low'] - price_min) / price_range)
+        # Positions of every candle at once
+        xs = x + spacing * np.arange(num_candles) + spacing / 2
+        ys = y + h * (1 - (ohlc - price_min) / price_range)
+        bullish = ohlc[:, 3] >= ohlc[:, 0]
 
+        for i, (cx, (open_y, high_y, low_y, close_y), is_bullish) in enumerate(
+                zip(xs.tolist(), ys.tolist(), bullish.tolist())):
             # Determine if bullish or bearish
-            is_bullish = candle['close'] >= candle['open']
             color = self.bull_color if is_bullish else self.bear_color
 
             # Is this the current candle?
@@ -1401,7 +2020,7 @@ class LiveCandlestickChart(QWidget):
                 # Draw glow
                 glow_color = QColor(color)
                 glow_color.setAlpha(int(100 * glow_intensity))
-                painter.setBrush(QBrush(glow_color))
+                painter.setBrush(glow_color)
                 painter.setPen(Qt.PenStyle.NoPen)
 
                 body_top = min(open_y, close_y)
@@ -1410,6 +2029,7 @@ class LiveCandlestickChart(QWidget):
                 glow_rect = QRectF(cx - candle_width/2 - 4, body_top - 4,
                                   candle_width + 8, body_height + 8)
                 painter.drawRoundedRect(glow_rect, 3, 3)
+                self._pulse_region = QRegion(glow_rect.adjusted(-1, -1, 1, 1).toAlignedRect())
 
             # Draw wick
             painter.setPen(QPen(color, 1))
@@ -1420,9 +2040,9 @@ class LiveCandlestickChart(QWidget):
             body_height = max(1, abs(close_y - open_y))
 
             if is_bullish:
-                painter.setBrush(QBrush(color))
+                painter.setBrush(color)
             else:
-                painter.setBrush(QBrush(color))
+                painter.setBrush(color)
 
             painter.setPen(QPen(color.darker(120), 1))
 
@@ -1431,8 +2051,8 @@ class LiveCandlestickChart(QWidget):
 
     def _draw_title(self, painter, width):
         """Draw chart title"""
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        painter.setPen(QPen(QColor(200, 210, 220)))
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_color)
 
         title_rect = QRectF(0, 10, width, 30)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
@@ -1443,6 +2063,9 @@ class LiveBarChart(QWidget):
     Animated bar chart with smooth transitions
     """
 
+    # Only a glow pulse animates between data updates, which reads fine at 30 fps
+    FPS = 30
+
     def __init__(self,
                  title: str = "Bar Chart",
                  categories: list = None,
@@ -1460,61 +2083,117 @@ class LiveBarChart(QWidget):
             QColor(200, 150, 255),
         ]
 
-        # Current and target values for animation
-        self._values = {}
-        self._target_values = {}
-        self._display_values = {}
+        # Target and displayed values, parallel to self.categories
+        self._category_index = {cat: i for i, cat in enumerate(self.categories)}
+        self._targets = np.zeros(len(self.categories))
+        self._displays = np.zeros(len(self.categories))
+
+        # Value at the top of the plot, changed only by data updates
+        self._scale = 1.0
 
         # Animation
         self._glow_phase = 0.0
 
-        self.setMinimumSize(400, 250)
+        # While no bar is moving only the glowing plot area repaints
+        self._dirty = True
+        self._pulse_region = QRegion()
+
+        # Background, grid, value labels and title, redrawn on resize or scale change
+        self._static_cache = None
+        self._static_range = None
+
+        # Paint objects reused every frame
+        self._bg_brush = _chart_background_brush(QColor(25, 30, 40), QColor(15, 20, 30))
+        self._frame_pen = QPen(QColor(60, 70, 80), 1)
+        self._grid_pen = QPen(QColor(50, 60, 70), 1, Qt.PenStyle.DotLine)
+        self._grid_label_color = QColor(150, 160, 170)
+        self._grid_font = QFont("Arial", 9)
+        self._value_font = QFont("Arial", 10, QFont.Weight.Bold)
+        self._category_font = QFont("Arial", 9)
+        self._category_color = QColor(180, 190, 200)
+        self._title_font = QFont("Arial", 14, QFont.Weight.Bold)
+        self._title_color = QColor(200, 210, 220)
+        self._glow_color = QColor()
+
+        # Bar fill brush and outline pen per bar color, built on first use
+        self._bar_paints = {}
 
-        # Animation timers
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._animate)
-        self.animation_timer.start(16)
+        self.setMinimumSize(400, 250)
 
-        self.value_timer = QTimer(self)
-        self.value_timer.timeout.connect(self._animate_values)
-        self.value_timer.start(16)
+        # Animation driven by the shared frame clock, throttled to FPS
+        self._pending_dt = 0.0
+        FrameClock.instance().attach(self, self._animate)
 
     def setCategories(self, categories: list):
         """Set category labels"""
+        targets = np.zeros(len(categories))
+        displays = np.zeros(len(categories))
+        for i, cat in enumerate(categories):
+            old = self._category_index.get(cat)
+            if old is not None:
+                targets[i] = self._targets[old]
+                displays[i] = self._displays[old]
+
         self.categories = categories
-        for cat in categories:
-            if cat not in self._values:
-                self._values[cat] = 0
-                self._target_values[cat] = 0
-                self._display_values[cat] = 0
+        self._category_index = {cat: i for i, cat in enumerate(categories)}
+        self._targets = targets
+        self._displays = displays
+        self._update_scale()
+        self._dirty = True
 
     def setValue(self, category: str, value: float):
         """Set value for a category with animation"""
-        if category not in self.categories:
+        index = self._category_index.get(category)
+        if index is None:
             self.categories.append(category)
+            index = len(self._targets)
+            self._category_index[category] = index
+            self._targets = np.append(self._targets, 0.0)
+            self._displays = np.append(self._displays, 0.0)
 
-        self._target_values[category] = value
-        if category not in self._display_values:
-            self._display_values[category] = 0
+        self._targets[index] = value
+        self._update_scale()
+        self._dirty = True
 
     def setValues(self, values: dict):
         """Set multiple values"""
         for category, value in values.items():
             self.setValue(category, value)
 
-    def _animate(self):
-        self._glow_phase += 0.03
+    def _update_scale(self):
+        # Bars only ease between their displayed and target values, so this
+        # covers every frame until the next update
+        self._scale = float(max(np.max(self._targets, initial=1), np.max(self._displays, initial=1)))
+
+    def _animate(self, dt: float):
+        if not is_showing(self):
+            return
+
+        # Skip clock ticks until a frame at FPS is due; 0.9 allows for timer jitter
+        self._pending_dt += dt
+        if self._pending_dt < 0.9 / self.FPS:
+            return
+        step = self._pending_dt * 60  # frames elapsed at 60 fps
+        self._pending_dt = 0.0
+
+        self._glow_phase += 0.03 * step
         if self._glow_phase > 2 * math.pi:
             self._glow_phase -= 2 * math.pi
-        self.update()
 
-    def _animate_values(self):
-        for category in self._target_values:
-            if category in self._display_values:
-                diff = self._target_values[category] - self._display_values[category]
-                if abs(diff) > 0.1:
-                    self._display_values[category] += diff * 0.1
-                    self._values[category] = self._display_values[category]
+        self._animate_values(step)
+
+        if self._dirty:
+            self._dirty = False
+            self.update()
+        else:
+            self.update(self._pulse_region)
+
+    def _animate_values(self, step: float):
+        diff = self._targets - self._displays
+        moving = np.abs(diff) > 0.1
+        if moving.any():
+            self._displays[moving] += diff[moving] * (1 - 0.9 ** step)
+            self._dirty = True
 
     def paintEvent(self, event):
         if not self.categories:
@@ -1535,47 +2214,74 @@ class LiveBarChart(QWidget):
         chart_width = width - margin_left - margin_right
         chart_height = height - margin_top - margin_bottom
 
-        # Draw background
-        self._draw_background(painter, margin_left, margin_top, chart_width, chart_height)
-
-        # Calculate max value
-        max_value = max([self._display_values.get(c, 0) for c in self.categories] + [1])
+        max_value = self._scale
 
-        # Draw grid
-        self._draw_grid(painter, margin_left, margin_top, chart_width, chart_height, max_value)
+        # Draw background, grid and title from the cache
+        if self._static_cache is None or self._static_range != max_value:
+            self._static_cache = self._build_static_cache(margin_left, margin_top,
+                                                          chart_width, chart_height, max_value)
+            self._static_range = max_value
+        painter.drawPixmap(0, 0, self._static_cache)
 
         # Draw bars
         self._draw_bars(painter, margin_left, margin_top, chart_width, chart_height, max_value)
 
-        # Draw title
-        self._draw_title(painter, width)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache = None
+
+    def _build_static_cache(self, x, y, w, h, max_value):
+        """Render the background, value grid and title into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        cache = QPixmap(self.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        cache.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(painter, x, y, w, h)
+        self._draw_grid(painter, x, y, w, h, max_value)
+        self._draw_title(painter, self.width())
+        painter.end()
+
+        return cache
 
     def _draw_background(self, painter, x, y, w, h):
         """Draw chart background"""
-        bg_gradient = QLinearGradient(x, y, x, y + h)
-        bg_gradient.setColorAt(0, QColor(25, 30, 40))
-        bg_gradient.setColorAt(1, QColor(15, 20, 30))
-
-        painter.setBrush(QBrush(bg_gradient))
-        painter.setPen(QPen(QColor(60, 70, 80), 1))
+        painter.setBrush(self._bg_brush)
+        painter.setPen(self._frame_pen)
         painter.drawRoundedRect(QRectF(x, y, w, h), 5, 5)
 
     def _draw_grid(self, painter, x, y, w, h, max_value):
         """Draw horizontal grid lines"""
-        painter.setPen(QPen(QColor(50, 60, 70), 1, Qt.PenStyle.DotLine))
-        painter.setFont(QFont("Arial", 9))
-
         num_lines = 5
-        for i in range(num_lines + 1):
-            line_y = y + h - (h * i / num_lines)
-            painter.drawLine(QPointF(x, line_y), QPointF(x + w, line_y))
+        line_ys = [y + h - (h * i / num_lines) for i in range(num_lines + 1)]
+
+        # Grid lines
+        painter.setPen(self._grid_pen)
+        painter.drawLines([QLineF(x, line_y, x + w, line_y) for line_y in line_ys])
 
+        # Value labels
+        painter.setPen(self._grid_label_color)
+        painter.setFont(self._grid_font)
+        for i, line_y in enumerate(line_ys):
             value = max_value * i / num_lines
-            painter.setPen(QPen(QColor(150, 160, 170)))
             label_rect = QRectF(5, line_y - 8, x - 10, 16)
             painter.drawText(label_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
                            f"{value:.0f}")
-            painter.setPen(QPen(QColor(50, 60, 70), 1, Qt.PenStyle.DotLine))
+
+    def _bar_paint(self, color):
+        """Gradient brush spanning whatever bar it fills, and outline pen, for a color"""
+        paint = self._bar_paints.get(color.rgba())
+        if paint is None:
+            gradient = QLinearGradient(0, 0, 1, 0)
+            gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
+            gradient.setColorAt(0, color.lighter(120))
+            gradient.setColorAt(0.5, color)
+            gradient.setColorAt(1, color.darker(110))
+            paint = (QBrush(gradient), QPen(color.darker(130), 1))
+            self._bar_paints[color.rgba()] = paint
+        return paint
 
     def _draw_bars(self, painter, x, y, w, h, max_value):
         """Draw animated bars"""
@@ -1586,8 +2292,10 @@ class LiveBarChart(QWidget):
         bar_width = (w / num_bars) * 0.6
         spacing = w / num_bars
 
-        for i, category in enumerate(self.categories):
-            value = self._display_values.get(category, 0)
+        # Bars and their glow stay within the plot, plus the glow's 6 px spread
+        self._pulse_region = QRegion(QRectF(x, y, w, h).adjusted(-6, -6, 6, 0).toAlignedRect())
+
+        for i, (category, value) in enumerate(zip(self.categories, self._displays.tolist())):
             bar_height = (value / max_value) * h if max_value > 0 else 0
 
             bar_x = x + spacing * i + (spacing - bar_width) / 2
@@ -1599,39 +2307,35 @@ class LiveBarChart(QWidget):
             glow_intensity = 0.6 + 0.4 * math.sin(self._glow_phase + i * 0.5)
 
             # Draw glow
+            glow_color = self._glow_color
+            glow_color.setRgb(color.rgb())
+            painter.setPen(Qt.PenStyle.NoPen)
             for j in range(3, 0, -1):
-                glow_color = QColor(color)
                 glow_color.setAlpha(int(40 * glow_intensity * (4 - j) / 3))
-
-                painter.setBrush(QBrush(glow_color))
-                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(glow_color)
 
                 glow_rect = QRectF(bar_x - j * 2, bar_y - j * 2,
                                   bar_width + j * 4, bar_height + j * 2)
                 painter.drawRoundedRect(glow_rect, 4, 4)
 
             # Draw bar
-            bar_gradient = QLinearGradient(bar_x, bar_y, bar_x + bar_width, bar_y)
-            bar_gradient.setColorAt(0, color.lighter(120))
-            bar_gradient.setColorAt(0.5, color)
-            bar_gradient.setColorAt(1, color.darker(110))
-
-            painter.setBrush(QBrush(bar_gradient))
-            painter.setPen(QPen(color.darker(130), 1))
+            bar_brush, bar_pen = self._bar_paint(color)
+            painter.setBrush(bar_brush)
+            painter.setPen(bar_pen)
 
             bar_rect = QRectF(bar_x, bar_y, bar_width, bar_height)
             painter.drawRoundedRect(bar_rect, 3, 3)
 
             # Value on top
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            painter.setPen(QPen(color))
+            painter.setFont(self._value_font)
+            painter.setPen(color)
 
             value_rect = QRectF(bar_x - 10, bar_y - 25, bar_width + 20, 20)
             painter.drawText(value_rect, Qt.AlignmentFlag.AlignCenter, f"{value:.1f}")
 
             # Category label
-            painter.setFont(QFont("Arial", 9))
-            painter.setPen(QPen(QColor(180, 190, 200)))
+            painter.setFont(self._category_font)
+            painter.setPen(self._category_color)
 
             label_rect = QRectF(bar_x - 10, y + h + 10, bar_width + 20, 30)
             painter.drawText(label_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
@@ -1639,8 +2343,8 @@ class LiveBarChart(QWidget):
 
     def _draw_title(self, painter, width):
         """Draw chart title"""
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        painter.setPen(QPen(QColor(200, 210, 220)))
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_color)
 
         title_rect = QRectF(0, 10, width, 30)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
@@ -1650,6 +2354,60 @@ class LiveBarChart(QWidget):
 # MAIN DASHBOARD WINDOW
 # ============================================================================
 
+# Dark theme, applied once to the whole application in main()
+DARK_STYLESHEET = """
+    QMainWindow {
+        background-color: #0a0e14;
+    }
+    QWidget {
+        background-color: #0a0e14;
+        color: #e0e0e0;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #2a3040;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #12161c;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 5px;
+        color: #00d4ff;
+    }
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+"""
+
+
+# Gauges in layout order: attribute name, constructor arguments, then the
+# simulated random walk's per-tick step range and clamp range
+PILL_GAUGE_SPECS = (
+    ("pnl_gauge", ("P&L", "Profit & Loss", -10000, 10000, "$", "gold"), (-100, 120), (-10000, 10000)),
+    ("win_rate_gauge", ("Win Rate", "Success Rate", 0, 100, "%", "green"), (-0.5, 0.5), (40, 80)),
+    ("risk_gauge", ("Risk Level", "Portfolio Risk", 0, 100, "%", "red"), (-1, 1), (10, 60)),
+    ("latency_gauge", ("Latency", "System Delay", 0, 200, "ms", "blue"), (-5, 5), (10, 150)),
+    ("throughput_gauge", ("Throughput", "Transaction Rate", 0, 1000, " TPS", "cyan"), (-20, 20), (100, 800)),
+)
+
+CIRCULAR_GAUGE_SPECS = (
+    ("cpu_gauge", ("CPU Usage", 0, 100, "%", "cyan"), (-3, 3), (10, 90)),
+    ("memory_gauge", ("Memory", 0, 100, "%", "orange"), (-1, 1), (30, 80)),
+    ("network_gauge", ("Network", 0, 100, "Mbps", "green"), (-5, 5), (20, 95)),
+    ("accuracy_gauge", ("Accuracy", 0, 100, "%", "purple"), (-0.5, 0.5), (60, 99)),
+)
+
+SPEEDOMETER_SPECS = (
+    ("speed_gauge", ("Order Rate", 0, 500, "OPS", 350, 450), (-20, 20), (50, 480)),
+    ("load_gauge", ("System Load", 0, 100, "%", 70, 90), (-3, 3), (20, 95)),
+)
+
+
 class AnimatedGaugeDashboard(QMainWindow):
     """
     Main dashboard window with animated gauges and live charts
@@ -1661,36 +2419,6 @@ class AnimatedGaugeDashboard(QMainWindow):
         self.setWindowTitle("Animated Trading Dashboard")
         self.setGeometry(100, 100, 1600, 900)
 
-        # Set dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0a0e14;
-            }
-            QWidget {
-                background-color: #0a0e14;
-                color: #e0e0e0;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #2a3040;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #12161c;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 5px;
-                color: #00d4ff;
-            }
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -1724,57 +2452,10 @@ class AnimatedGaugeDashboard(QMainWindow):
         gauges_group = QGroupBox("⚡ Core Metrics")
         gauges_layout = QVBoxLayout(gauges_group)
 
-        # Create pill gauges
-        self.pnl_gauge = AnimatedPillGauge(
-            title="P&L",
-            subtitle="Profit & Loss",
-            min_value=-10000,
-            max_value=10000,
-            unit="$",
-            color_scheme="gold"
-        )
-
-        self.win_rate_gauge = AnimatedPillGauge(
-            title="Win Rate",
-            subtitle="Success Rate",
-            min_value=0,
-            max_value=100,
-            unit="%",
-            color_scheme="green"
-        )
-
-        self.risk_gauge = AnimatedPillGauge(
-            title="Risk Level",
-            subtitle="Portfolio Risk",
-            min_value=0,
-            max_value=100,
-            unit="%",
-            color_scheme="red"
-        )
-
-        self.latency_gauge = AnimatedPillGauge(
-            title="Latency",
-            subtitle="System Delay",
-            min_value=0,
-            max_value=200,
-            unit="ms",
-            color_scheme="blue"
-        )
-
-        self.throughput_gauge = AnimatedPillGauge(
-            title="Throughput",
-            subtitle="Transaction Rate",
-            min_value=0,
-            max_value=1000,
-            unit=" TPS",
-            color_scheme="cyan"
-        )
-
-        gauges_layout.addWidget(self.pnl_gauge)
-        gauges_layout.addWidget(self.win_rate_gauge)
-        gauges_layout.addWidget(self.risk_gauge)
-        gauges_layout.addWidget(self.latency_gauge)
-        gauges_layout.addWidget(self.throughput_gauge)
+        for name, args, _, _ in PILL_GAUGE_SPECS:
+            gauge = AnimatedPillGauge(*args)
+            setattr(self, name, gauge)
+            gauges_layout.addWidget(gauge)
 
         content_layout.addWidget(gauges_group)
 
@@ -1782,42 +2463,10 @@ class AnimatedGaugeDashboard(QMainWindow):
         circular_group = QGroupBox("🎯 Performance Indicators")
         circular_layout = QHBoxLayout(circular_group)
 
-        self.cpu_gauge = AnimatedCircularGauge(
-            title="CPU Usage",
-            min_value=0,
-            max_value=100,
-            unit="%",
-            color_scheme="cyan"
-        )
-
-        self.memory_gauge = AnimatedCircularGauge(
-            title="Memory",
-            min_value=0,
-            max_value=100,
-            unit="%",
-            color_scheme="orange"
-        )
-
-        self.network_gauge = AnimatedCircularGauge(
-            title="Network",
-            min_value=0,
-            max_value=100,
-            unit="Mbps",
-            color_scheme="green"
-        )
-
-        self.accuracy_gauge = AnimatedCircularGauge(
-            title="Accuracy",
-            min_value=0,
-            max_value=100,
-            unit="%",
-            color_scheme="purple"
-        )
-
-        circular_layout.addWidget(self.cpu_gauge)
-        circular_layout.addWidget(self.memory_gauge)
-        circular_layout.addWidget(self.network_gauge)
-        circular_layout.addWidget(self.accuracy_gauge)
+        for name, args, _, _ in CIRCULAR_GAUGE_SPECS:
+            gauge = AnimatedCircularGauge(*args)
+            setattr(self, name, gauge)
+            circular_layout.addWidget(gauge)
 
         content_layout.addWidget(circular_group)
 
@@ -1825,26 +2474,10 @@ class AnimatedGaugeDashboard(QMainWindow):
         speed_group = QGroupBox("🚀 System Metrics")
         speed_layout = QHBoxLayout(speed_group)
 
-        self.speed_gauge = AnimatedSpeedometer(
-            title="Order Rate",
-            min_value=0,
-            max_value=500,
-            unit="OPS",
-            warning_threshold=350,
-            critical_threshold=450
-        )
-
-        self.load_gauge = AnimatedSpeedometer(
-            title="System Load",
-            min_value=0,
-            max_value=100,
-            unit="%",
-            warning_threshold=70,
-            critical_threshold=90
-        )
-
-        speed_layout.addWidget(self.speed_gauge)
-        speed_layout.addWidget(self.load_gauge)
+        for name, args, _, _ in SPEEDOMETER_SPECS:
+            gauge = AnimatedSpeedometer(*args)
+            setattr(self, name, gauge)
+            speed_layout.addWidget(gauge)
 
         content_layout.addWidget(speed_group)
 
@@ -1878,14 +2511,8 @@ class AnimatedGaugeDashboard(QMainWindow):
 
         self.volume_chart = LiveBarChart(
             title="Trading Volume by Asset",
-            categories=["BTC", "ETH", "SOL", "ADA", "DOT"],
-            colors=[
-                QColor(247, 147, 26),  # BTC orange
-                QColor(98, 126, 234),   # ETH blue
-                QColor(0, 255, 163),    # SOL green
-                QColor(0, 51, 173),     # ADA blue
-                QColor(230, 0, 122),    # DOT pink
-            ]
+            categories=list(ASSET_COLORS),
+            colors=list(ASSET_COLORS.values())
         )
 
         self.latency_chart = LiveLineChart(
@@ -1911,20 +2538,33 @@ class AnimatedGaugeDashboard(QMainWindow):
 
     def start_data_simulation(self):
         """Start simulating data updates"""
-        # Gauge update timer
-        self.gauge_timer = QTimer(self)
-        self.gauge_timer.timeout.connect(self.update_gauges)
-        self.gauge_timer.start(100)  # 10 Hz
-
-        # Chart update timer
-        self.chart_timer = QTimer(self)
-        self.chart_timer.timeout.connect(self.update_charts)
-        self.chart_timer.start(500)  # 2 Hz
-
-        # Candlestick update timer
-        self.candle_timer = QTimer(self)
-        self.candle_timer.timeout.connect(self.update_candles)
-        self.candle_timer.start(2000)  # Every 2 seconds
+        # One generator for all simulated data
+        self._rng = np.random.default_rng()
+
+        # All gauge random walks live in one array, stepped by one batched draw
+        # and clipped per tick; entries follow the gauge spec tables
+        specs = PILL_GAUGE_SPECS + CIRCULAR_GAUGE_SPECS + SPEEDOMETER_SPECS
+        steps = np.array([step for _, _, step, _ in specs], dtype=np.float64)
+        bounds = np.array([bound for _, _, _, bound in specs], dtype=np.float64)
+        self._walk_gauges = [getattr(self, name) for name, _, _, _ in specs]
+        self._walk_values = np.array([g.value() for g in self._walk_gauges], dtype=np.float64)
+        self._walk_step_low = steps[:, 0].copy()
+        self._walk_step_high = steps[:, 1].copy()
+        self._walk_min = bounds[:, 0].copy()
+        self._walk_max = bounds[:, 1].copy()
+
+        # Volume bar chart values, drawn in one call into a dict that is reused
+        self._volume_assets = ("BTC", "ETH", "SOL", "ADA", "DOT")
+        self._volume_low = np.array([500, 300, 200, 100, 150], dtype=np.float64)
+        self._volume_high = np.array([1500, 1000, 800, 500, 600], dtype=np.float64)
+        self._volume_values = dict.fromkeys(self._volume_assets, 0.0)
+
+        # One simulation timer at the gauge rate; charts and candles update
+        # on every 5th and 20th tick
+        self._sim_tick = 0
+        self.sim_timer = QTimer(self)
+        self.sim_timer.timeout.connect(self._on_sim_tick)
+        self.sim_timer.start(100)  # 10 Hz
 
         # Initialize candle data
         self.current_price = 50000
@@ -1932,24 +2572,24 @@ class AnimatedGaugeDashboard(QMainWindow):
         self.candle_high = self.current_price
         self.candle_low = self.current_price
 
+    def _on_sim_tick(self):
+        """Run the simulation updates due on this tick"""
+        self._sim_tick += 1
+        self.update_gauges()
+        if self._sim_tick % 5 == 0:
+            self.update_charts()  # 2 Hz
+        if self._sim_tick % 20 == 0:
+            self.update_candles()  # Every 2 seconds
+
     def update_gauges(self):
         """Update gauge values with simulated data"""
         # Smooth random walks for realistic data
-        self.pnl_gauge.setValue(self.pnl_gauge.value() + random.uniform(-100, 120))
-        self.win_rate_gauge.setValue(max(40, min(80, self.win_rate_gauge.value() + random.uniform(-0.5, 0.5))))
-        self.risk_gauge.setValue(max(10, min(60, self.risk_gauge.value() + random.uniform(-1, 1))))
-        self.latency_gauge.setValue(max(10, min(150, self.latency_gauge.value() + random.uniform(-5, 5))))
-        self.throughput_gauge.setValue(max(100, min(800, self.throughput_gauge.value() + random.uniform(-20, 20))))
-
-        # Circular gauges
-        self.cpu_gauge.setValue(max(10, min(90, self.cpu_gauge.value() + random.uniform(-3, 3))))
-        self.memory_gauge.setValue(max(30, min(80, self.memory_gauge.value() + random.uniform(-1, 1))))
-        self.network_gauge.setValue(max(20, min(95, self.network_gauge.value() + random.uniform(-5, 5))))
-        self.accuracy_gauge.setValue(max(60, min(99, self.accuracy_gauge.value() + random.uniform(-0.5, 0.5))))
-
-        # Speedometers
-        self.speed_gauge.setValue(max(50, min(480, self.speed_gauge.value() + random.uniform(-20, 20))))
-        self.load_gauge.setValue(max(20, min(95, self.load_gauge.value() + random.uniform(-3, 3))))
+        values = self._walk_values
+        values += self._rng.uniform(self._walk_step_low, self._walk_step_high)
+        np.clip(values, self._walk_min, self._walk_max, out=values)
+
+        for gauge, value in zip(self._walk_gauges, values.tolist()):
+            gauge.setValue(value)
 
     def update_charts(self):
         """Update chart data"""
@@ -1960,19 +2600,17 @@ class AnimatedGaugeDashboard(QMainWindow):
         self.latency_chart.addDataPoint(self.latency_gauge.value())
 
         # Volume bar chart
-        self.volume_chart.setValues({
-            "BTC": random.uniform(500, 1500),
-            "ETH": random.uniform(300, 1000),
-            "SOL": random.uniform(200, 800),
-            "ADA": random.uniform(100, 500),
-            "DOT": random.uniform(150, 600),
-        })
+        volumes = self._rng.uniform(self._volume_low, self._volume_high).tolist()
+        self._volume_values.update(zip(self._volume_assets, volumes))
+        self.volume_chart.setValues(self._volume_values)
 
         # Update current candle
-        price_change = random.uniform(-100, 100)
+        price_change = self._rng.uniform(-100, 100)
         self.current_price += price_change
-        self.candle_high = max(self.candle_high, self.current_price)
-        self.candle_low = min(self.candle_low, self.current_price)
+        if self.current_price > self.candle_high:
+            self.candle_high = self.current_price
+        elif self.current_price < self.candle_low:
+            self.candle_low = self.current_price
 
         self.price_chart.updateCurrentCandle(
             self.candle_open,
@@ -2007,6 +2645,7 @@ def main():
 
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(DARK_STYLESHEET)
 
     # Create and show dashboard
     dashboard = AnimatedGaugeDashboard()
@@ -0,0 +1,85 @@
+"""
+SHARED FRAME CLOCK
+One application-wide animation tick for every animated widget
+"""
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+# Frame time for widgets that only animate decorative phases (~15 fps)
+IDLE_FRAME_TIME = 1 / 15
+
+
+class FrameClock(QObject):
+    """
+    Application-wide animation clock shared by all animated widgets, running
+    at the display refresh rate capped to 60 Hz.
+    Emits tick(dt) with the seconds elapsed since the previous tick.
+    """
+
+    tick = pyqtSignal(float)
+
+    _instance = None
+
+    def __init__(self, interval_ms: int = 16):
+        super().__init__()
+
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+
+        # Don't tick faster than a slower display can show
+        screen = QGuiApplication.primaryScreen()
+        if screen is not None and screen.refreshRate() > 0:
+            interval_ms = max(interval_ms, round(1000 / screen.refreshRate()))
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_timeout)
+        self._timer.start(interval_ms)
+
+        # Nothing is drawn while the application is hidden or suspended
+        QGuiApplication.instance().applicationStateChanged.connect(self._on_state_changed)
+
+    @classmethod
+    def instance(cls) -> "FrameClock":
+        """Return the shared clock, creating and starting it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def attach(self, widget: QObject, slot):
+        """Connect slot to tick for as long as widget is alive"""
+        self.tick.connect(slot)
+        widget.destroyed.connect(lambda: self._detach(slot))
+
+    def _detach(self, slot):
+        try:
+            self.tick.disconnect(slot)
+        except RuntimeError:
+            # The clock itself was already deleted during application exit
+            pass
+
+    def _on_timeout(self):
+        # Clamp so a stalled event loop doesn't make animations jump
+        dt = min(self._elapsed.restart() / 1000.0, 0.1)
+        self.tick.emit(dt)
+
+    def _on_state_changed(self, state):
+        if state in (Qt.ApplicationState.ApplicationHidden,
+                     Qt.ApplicationState.ApplicationSuspended):
+            self._timer.stop()
+        elif not self._timer.isActive():
+            self._elapsed.restart()
+            self._timer.start()
+
+
+def is_showing(widget: QWidget) -> bool:
+    """
+    True if the widget is visible in a window that isn't minimized and some
+    part of it isn't clipped away, e.g. scrolled out of a QScrollArea.
+    Gate only drawing on this: state other widgets read, such as a gauge's
+    value(), must keep updating while it returns False.
+    """
+    return (widget.isVisible()
+            and not widget.window().isMinimized()
+            and not widget.visibleRegion().isEmpty())
@@ -6,21 +6,13 @@ Run the complete animated gauges and charts dashboard
 
 import sys
 import argparse
+import importlib.util
 
 
 def check_dependencies():
     """Check and report missing dependencies"""
-    missing = []
-
-    try:
-        from PyQt6.QtWidgets import QApplication
-    except ImportError:
-        missing.append("PyQt6")
-
-    try:
-        import numpy
-    except ImportError:
-        missing.append("numpy")
+    # find_spec only locates the packages; they are imported when a dashboard runs
+    missing = [name for name in ("PyQt6", "numpy") if importlib.util.find_spec(name) is None]
 
     if missing:
         print("❌ Missing dependencies:")
@@ -45,11 +37,94 @@ def run_advanced_dashboard():
     main()
 
 
+# Combined dashboard theme, applied once to the whole application
+COMBINED_STYLESHEET = """
+    QMainWindow {
+        background-color: #05080d;
+    }
+    QWidget {
+        background-color: transparent;
+        color: #e0e0e0;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #1a2030;
+        border-radius: 10px;
+        margin-top: 12px;
+        padding-top: 12px;
+        background-color: rgba(15, 20, 30, 200);
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 8px;
+        color: #00d4ff;
+        font-size: 13px;
+    }
+    QScrollArea {
+        border: none;
+    }
+    QTabWidget::pane {
+        border: 1px solid #2a3040;
+        background-color: rgba(15, 20, 30, 150);
+        border-radius: 8px;
+    }
+    QTabBar::tab {
+        background-color: #1a2030;
+        color: #8090a0;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+    }
+    QTabBar::tab:selected {
+        background-color: #00d4ff;
+        color: #000000;
+        font-weight: bold;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #2a3a50;
+    }
+"""
+
+
+# Combined dashboard gauges in layout order: attribute name, constructor
+# arguments, then the simulated random walk's per-tick step range and clamp range
+COMBINED_PILL_SPECS = (
+    ("pnl_gauge", ("P&L", "Total Profit/Loss", -10000, 10000, "$", "gold"), (-100, 120), (-10000, 10000)),
+    ("win_rate_gauge", ("Win Rate", "Success %", 0, 100, "%", "green"), (-0.5, 0.5), (40, 80)),
+    ("risk_gauge", ("Risk", "Exposure Level", 0, 100, "%", "red"), (-1, 1), (10, 60)),
+    ("latency_gauge", ("Latency", "Response Time", 0, 200, "ms", "blue"), (-5, 5), (10, 150)),
+)
+
+COMBINED_CIRCULAR_SPECS = (
+    ("cpu_gauge", ("CPU", 0, 100, "%", "cyan"), (-3, 3), (10, 90)),
+    ("memory_gauge", ("Memory", 0, 100, "%", "orange"), (-1, 1), (30, 80)),
+    ("network_gauge", ("Network", 0, 100, "Mbps", "green"), (-5, 5), (20, 95)),
+    ("accuracy_gauge", ("Accuracy", 0, 100, "%", "purple"), (-0.5, 0.5), (60, 99)),
+)
+
+COMBINED_SPEEDOMETER_SPECS = (
+    ("order_speed", ("Order Rate", 0, 500, "OPS", 350, 450), (-20, 20), (50, 480)),
+    ("system_load", ("System Load", 0, 100, "%", 70, 90), (-3, 3), (20, 95)),
+)
+
+
 def run_combined_dashboard():
     """Run a combined dashboard with all widgets"""
-    from PyQt6.QtWidgets import *
-    from PyQt6.QtCore import *
-    from PyQt6.QtGui import *
+    from PyQt6.QtWidgets import (
+        QApplication,
+        QGroupBox,
+        QHBoxLayout,
+        QLabel,
+        QMainWindow,
+        QTabWidget,
+        QVBoxLayout,
+        QWidget
+    )
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtGui import QColor
 
     from animated_gauges_dashboard import (
         AnimatedPillGauge,
@@ -57,7 +132,8 @@ def run_combined_dashboard():
         AnimatedSpeedometer,
         LiveLineChart,
         LiveCandlestickChart,
-        LiveBarChart
+        LiveBarChart,
+        ASSET_COLORS
     )
 
     from advanced_visualizations import (
@@ -65,12 +141,12 @@ def run_combined_dashboard():
         AnimatedHeatmap,
         AnimatedProgressRing,
         AnimatedWaveform,
-        ParticleBackground
+        create_particle_background,
+        configure_opengl
     )
 
-    import random
     import numpy as np
-    from datetime import datetime
+    import time
 
     class CombinedDashboard(QMainWindow):
         def __init__(self):
@@ -79,63 +155,12 @@ def run_combined_dashboard():
             self.setWindowTitle("🚀 Complete Animated Trading Dashboard")
             self.setGeometry(50, 50, 1800, 1000)
 
-            # Dark theme
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #05080d;
-                }
-                QWidget {
-                    background-color: transparent;
-                    color: #e0e0e0;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                }
-                QGroupBox {
-                    font-weight: bold;
-                    border: 2px solid #1a2030;
-                    border-radius: 10px;
-                    margin-top: 12px;
-                    padding-top: 12px;
-                    background-color: rgba(15, 20, 30, 200);
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 15px;
-                    padding: 0 8px;
-                    color: #00d4ff;
-                    font-size: 13px;
-                }
-                QScrollArea {
-                    border: none;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #2a3040;
-                    background-color: rgba(15, 20, 30, 150);
-                    border-radius: 8px;
-                }
-                QTabBar::tab {
-                    background-color: #1a2030;
-                    color: #8090a0;
-                    padding: 10px 20px;
-                    margin-right: 2px;
-                    border-top-left-radius: 6px;
-                    border-top-right-radius: 6px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #00d4ff;
-                    color: #000000;
-                    font-weight: bold;
-                }
-                QTabBar::tab:hover:!selected {
-                    background-color: #2a3a50;
-                }
-            """)
-
             # Main widget with particle background
             main_widget = QWidget()
             self.setCentralWidget(main_widget)
 
             # Particle background
-            self.particles = ParticleBackground(main_widget)
+            self.particles = create_particle_background(main_widget)
             self.particles.setGeometry(0, 0, 1800, 1000)
             self.particles.num_particles = 80
             self.particles._init_particles()
@@ -169,9 +194,11 @@ def run_combined_dashboard():
             status_label.setStyleSheet("color: #00ff88; font-weight: bold; padding: 10px;")
             status_layout.addWidget(status_label)
 
-            time_label = QLabel(datetime.now().strftime("%H:%M:%S"))
-            time_label.setStyleSheet("color: #8090a0; padding: 10px;")
-            status_layout.addWidget(time_label)
+            self._time_label = QLabel()
+            self._time_label.setStyleSheet("color: #8090a0; padding: 10px;")
+            status_layout.addWidget(self._time_label)
+            self._clock_second = None
+            self._update_clock()
 
             header_layout.addWidget(status_widget)
             main_layout.addWidget(header)
@@ -188,30 +215,20 @@ def run_combined_dashboard():
             pill_group = QGroupBox("⚡ CORE METRICS")
             pill_layout = QVBoxLayout(pill_group)
 
-            self.pnl_gauge = AnimatedPillGauge("P&L", "Total Profit/Loss", -10000, 10000, "$", "gold")
-            self.win_rate_gauge = AnimatedPillGauge("Win Rate", "Success %", 0, 100, "%", "green")
-            self.risk_gauge = AnimatedPillGauge("Risk", "Exposure Level", 0, 100, "%", "red")
-            self.latency_gauge = AnimatedPillGauge("Latency", "Response Time", 0, 200, "ms", "blue")
-
-            pill_layout.addWidget(self.pnl_gauge)
-            pill_layout.addWidget(self.win_rate_gauge)
-            pill_layout.addWidget(self.risk_gauge)
-            pill_layout.addWidget(self.latency_gauge)
+            for name, args, _, _ in COMBINED_PILL_SPECS:
+                gauge = AnimatedPillGauge(*args)
+                setattr(self, name, gauge)
+                pill_layout.addWidget(gauge)
 
             gauges_layout.addWidget(pill_group)
 
             # Row 2: Circular gauges
             circular_row = QHBoxLayout()
 
-            self.cpu_gauge = AnimatedCircularGauge("CPU", 0, 100, "%", "cyan")
-            self.memory_gauge = AnimatedCircularGauge("Memory", 0, 100, "%", "orange")
-            self.network_gauge = AnimatedCircularGauge("Network", 0, 100, "Mbps", "green")
-            self.accuracy_gauge = AnimatedCircularGauge("Accuracy", 0, 100, "%", "purple")
-
-            circular_row.addWidget(self.cpu_gauge)
-            circular_row.addWidget(self.memory_gauge)
-            circular_row.addWidget(self.network_gauge)
-            circular_row.addWidget(self.accuracy_gauge)
+            for name, args, _, _ in COMBINED_CIRCULAR_SPECS:
+                gauge = AnimatedCircularGauge(*args)
+                setattr(self, name, gauge)
+                circular_row.addWidget(gauge)
 
             gauges_layout.addLayout(circular_row)
 
@@ -221,11 +238,10 @@ def run_combined_dashboard():
             speed_group = QGroupBox("🚀 SPEED METRICS")
             speed_layout = QHBoxLayout(speed_group)
 
-            self.order_speed = AnimatedSpeedometer("Order Rate", 0, 500, "OPS", 350, 450)
-            self.system_load = AnimatedSpeedometer("System Load", 0, 100, "%", 70, 90)
-
-            speed_layout.addWidget(self.order_speed)
-            speed_layout.addWidget(self.system_load)
+            for name, args, _, _ in COMBINED_SPEEDOMETER_SPECS:
+                gauge = AnimatedSpeedometer(*args)
+                setattr(self, name, gauge)
+                speed_layout.addWidget(gauge)
 
             speed_row.addWidget(speed_group)
             gauges_layout.addLayout(speed_row)
@@ -252,9 +268,8 @@ def run_combined_dashboard():
 
             self.volume_chart = LiveBarChart(
                 "Volume by Asset",
-                ["BTC", "ETH", "SOL", "ADA", "DOT"],
-                [QColor(247, 147, 26), QColor(98, 126, 234), QColor(0, 255, 163),
-                 QColor(0, 51, 173), QColor(230, 0, 122)]
+                list(ASSET_COLORS),
+                list(ASSET_COLORS.values())
             )
             self.latency_chart = LiveLineChart("Latency", "ms", 100, QColor(255, 100, 100))
 
@@ -313,6 +328,11 @@ def run_combined_dashboard():
 
             main_layout.addWidget(tabs)
 
+            # The advanced widgets keep no history, so they only get data while shown
+            self._tabs = tabs
+            self._advanced_tab = advanced_tab
+            tabs.currentChanged.connect(self._on_tab_changed)
+
             # Initialize price data
             self.current_price = 50000
             self.candle_open = self.current_price
@@ -324,53 +344,75 @@ def run_combined_dashboard():
 
             # Update time label
             self.time_timer = QTimer(self)
-            self.time_timer.timeout.connect(lambda: time_label.setText(
-                datetime.now().strftime("%H:%M:%S")
-            ))
+            self.time_timer.timeout.connect(self._update_clock)
             self.time_timer.start(1000)
 
         def resizeEvent(self, event):
             super().resizeEvent(event)
             self.particles.setGeometry(0, 0, self.width(), self.height())
 
+        def _update_clock(self):
+            """Show the local time, skipping ticks that land in the same second"""
+            now = time.localtime()
+            if now.tm_sec == self._clock_second:
+                return
+            self._clock_second = now.tm_sec
+            self._time_label.setText(f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}")
+
         def start_simulation(self):
             """Start all data simulations"""
-            # Gauges
-            self.gauge_timer = QTimer(self)
-            self.gauge_timer.timeout.connect(self.update_gauges)
-            self.gauge_timer.start(100)
-
-            # Charts
-            self.chart_timer = QTimer(self)
-            self.chart_timer.timeout.connect(self.update_charts)
-            self.chart_timer.start(500)
-
-            # Candles
-            self.candle_timer = QTimer(self)
-            self.candle_timer.timeout.connect(self.update_candles)
-            self.candle_timer.start(2000)
-
-            # Advanced
-            self.adv_timer = QTimer(self)
-            self.adv_timer.timeout.connect(self.update_advanced)
-            self.adv_timer.start(200)
+            # One generator for all simulated data
+            self._rng = np.random.default_rng()
+
+            # All gauge random walks live in one array, stepped by one batched draw
+            # and clipped per tick; entries follow the gauge spec tables
+            specs = COMBINED_PILL_SPECS + COMBINED_CIRCULAR_SPECS + COMBINED_SPEEDOMETER_SPECS
+            steps = np.array([step for _, _, step, _ in specs], dtype=np.float64)
+            bounds = np.array([bound for _, _, _, bound in specs], dtype=np.float64)
+            self._walk_gauges = [getattr(self, name) for name, _, _, _ in specs]
+            self._walk_values = np.array([g.value() for g in self._walk_gauges], dtype=np.float64)
+            self._walk_step_low = steps[:, 0].copy()
+            self._walk_step_high = steps[:, 1].copy()
+            self._walk_min = bounds[:, 0].copy()
+            self._walk_max = bounds[:, 1].copy()
+
+            # Volume bar chart values, drawn in one call into a dict that is reused
+            self._volume_assets = ("BTC", "ETH", "SOL", "ADA", "DOT")
+            self._volume_low = np.array([500, 300, 200, 100, 150], dtype=np.float64)
+            self._volume_high = np.array([1500, 1000, 800, 500, 600], dtype=np.float64)
+            self._volume_values = dict.fromkeys(self._volume_assets, 0.0)
+
+            # Advanced tab scalars, one batched draw per update:
+            # 5 radar categories followed by 3 progress rings
+            self._adv_low = np.array([40, 60, 50, 70, 45, 30, 40, 85], dtype=np.float64)
+            self._adv_high = np.array([90, 95, 85, 99, 80, 80, 70, 99], dtype=np.float64)
+            self._heatmap_arr = np.empty((7, 24), dtype=np.float32)
+
+            # One simulation timer at the gauge rate; the other updates run
+            # on every 2nd, 5th and 20th tick
+            self._sim_tick = 0
+            self.sim_timer = QTimer(self)
+            self.sim_timer.timeout.connect(self._on_sim_tick)
+            self.sim_timer.start(100)
+
+        def _on_sim_tick(self):
+            """Run the simulation updates due on this tick"""
+            self._sim_tick += 1
+            self.update_gauges()
+            if self._sim_tick % 2 == 0:
+                self.update_advanced()  # 5 Hz
+            if self._sim_tick % 5 == 0:
+                self.update_charts()  # 2 Hz
+            if self._sim_tick % 20 == 0:
+                self.update_candles()  # Every 2 seconds
 
         def update_gauges(self):
-            # Pill gauges
-            self.pnl_gauge.setValue(self.pnl_gauge.value() + random.uniform(-100, 120))
-            self.win_rate_gauge.setValue(max(40, min(80, self.win_rate_gauge.value() + random.uniform(-0.5, 0.5))))
-            self.risk_gauge.setValue(max(10, min(60, self.risk_gauge.value() + random.uniform(-1, 1))))
-            self.latency_gauge.setValue(max(10, min(150, self.latency_gauge.value() + random.uniform(-5, 5))))
-
-            # Circular gauges
-            self.cpu_gauge.setValue(max(10, min(90, self.cpu_gauge.value() + random.uniform(-3, 3))))
-            self.memory_gauge.setValue(max(30, min(80, self.memory_gauge.value() + random.uniform(-1, 1))))
-            self.network_gauge.setValue(max(20, min(95, self.network_gauge.value() + random.uniform(-5, 5))))
-            self.accuracy_gauge.setValue(max(60, min(99, self.accuracy_gauge.value() + random.uniform(-0.5, 0.5))))
-
-            # Speedometers
-            self.order_speed.setValue(max(50, min(480, self.order_speed.value() + random.uniform(-20, 20))))
-            self.system_load.setValue(max(20, min(95, self.system_load.value() + random.uniform(-3, 3))))
+            values = self._walk_values
+            values += self._rng.uniform(self._walk_step_low, self._walk_step_high)
+            np.clip(values, self._walk_min, self._walk_max, out=values)
+
+            for gauge, value in zip(self._walk_gauges, values.tolist()):
+                gauge.setValue(value)
 
         def update_charts(self):
             # Line charts
@@ -378,19 +420,17 @@ def run_combined_dashboard():
             self.latency_chart.addDataPoint(self.latency_gauge.value())
 
             # Bar chart
-            self.volume_chart.setValues({
-                "BTC": random.uniform(500, 1500),
-                "ETH": random.uniform(300, 1000),
-                "SOL": random.uniform(200, 800),
-                "ADA": random.uniform(100, 500),
-                "DOT": random.uniform(150, 600),
-            })
+            volumes = self._rng.uniform(self._volume_low, self._volume_high).tolist()
+            self._volume_values.update(zip(self._volume_assets, volumes))
+            self.volume_chart.setValues(self._volume_values)
 
             # Update current candle
-            price_change = random.uniform(-100, 100)
+            price_change = self._rng.uniform(-100, 100)
             self.current_price += price_change
-            self.candle_high = max(self.candle_high, self.current_price)
-            self.candle_low = min(self.candle_low, self.current_price)
+            if self.current_price > self.candle_high:
+                self.candle_high = self.current_price
+            elif self.current_price < self.candle_low:
+                self.candle_low = self.current_price
 
             self.price_chart.updateCurrentCandle(
                 self.candle_open,
@@ -410,31 +450,45 @@ def run_combined_dashboard():
             self.candle_high = self.current_price
             self.candle_low = self.current_price
 
+        def _on_tab_changed(self, index):
+            # Refresh the advanced widgets straight away rather than on the next tick
+            if self._tabs.widget(index) is self._advanced_tab:
+                self.update_advanced()
+
         def update_advanced(self):
+            if self._tabs.currentWidget() is not self._advanced_tab:
+                return
+
+            vals = self._rng.uniform(self._adv_low, self._adv_high).tolist()
+
             # Radar
             self.radar.setValues({
-                "Speed": random.uniform(40, 90),
-                "Accuracy": random.uniform(60, 95),
-                "Efficiency": random.uniform(50, 85),
-                "Reliability": random.uniform(70, 99),
-                "Throughput": random.uniform(45, 80),
+                "Speed": vals[0],
+                "Accuracy": vals[1],
+                "Efficiency": vals[2],
+                "Reliability": vals[3],
+                "Throughput": vals[4],
             })
 
             # Heatmap
-            data = np.random.random((7, 24)) * 0.5
-            data[random.randint(0, 6), random.randint(0, 23)] = random.uniform(0.7, 1.0)
+            data = self._heatmap_arr
+            self._rng.random(dtype=np.float32, out=data)
+            data *= 0.5
+            data[self._rng.integers(0, 7), self._rng.integers(0, 24)] = self._rng.uniform(0.7, 1.0)
             self.heatmap.setData(data)
 
             # Progress rings
-            self.ring1.setValue(random.uniform(30, 80))
-            self.ring2.setValue(random.uniform(40, 70))
-            self.ring3.setValue(random.uniform(85, 99))
+            self.ring1.setValue(vals[5])
+            self.ring2.setValue(vals[6])
+            self.ring3.setValue(vals[7])
 
             # Waveform
             self.waveform.setRandomValues()
 
+    configure_opengl()
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    app.setStyleSheet(COMBINED_STYLESHEET)
 
     dashboard = CombinedDashboard()
     dashboard.show()